@@ -0,0 +1,28 @@
+"""add_peer_ranking_indexes
+
+Revision ID: x9y0z1a2b3c4
+Revises: 921b4b33637d
+Create Date: 2026-03-12 10:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = 'x9y0z1a2b3c4'
+down_revision: Union[str, None] = '921b4b33637d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Peer ranking: same-grade students, then each one's best completed score
+    op.create_index('idx_user_grade_role', 'users', ['grade', 'role'])
+    op.create_index(
+        'idx_test_student_completed_score', 'test_sessions',
+        ['student_id', 'completed_at', 'score'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_test_student_completed_score', table_name='test_sessions')
+    op.drop_index('idx_user_grade_role', table_name='users')
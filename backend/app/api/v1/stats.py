@@ -796,16 +796,16 @@ async def get_enhanced_report(
     return EnhancedTestReport(
         test_session=session_resp,
         answers=[AnswerDetail(**a) for a in answers],
-        radar_metrics=RadarMetrics(**metrics["radar"]),
-        metric_details=[MetricDetail(**d) for d in metrics["metric_details"]],
-        peer_ranking=PeerRanking(**metrics["peer_ranking"]) if metrics["peer_ranking"] else None,
-        grade_level=metrics["grade_level"],
-        vocab_description=metrics["vocab_description"],
-        recommended_book=metrics["recommended_book"],
-        total_time_seconds=metrics["total_time_seconds"] or report_engine.session_duration_seconds(session.started_at, session.completed_at),
-        category_times=metrics["category_times"],
-        per_engine_stats=[EngineStats(**s) for s in metrics["per_engine_stats"]],
-        diagnosis=EngineDiagnosis(**metrics["diagnosis"]),
+        radar_metrics=RadarMetrics(**metrics.radar),
+        metric_details=[MetricDetail(**d) for d in metrics.metric_details],
+        peer_ranking=PeerRanking(**metrics.peer_ranking) if metrics.peer_ranking else None,
+        grade_level=metrics.grade_level,
+        vocab_description=metrics.vocab_description,
+        recommended_book=metrics.recommended_book,
+        total_time_seconds=metrics.total_time_seconds or report_engine.session_duration_seconds(session.started_at, session.completed_at),
+        category_times=metrics.category_times,
+        per_engine_stats=[EngineStats(**s) for s in metrics.per_engine_stats],
+        diagnosis=EngineDiagnosis(**metrics.diagnosis),
     )
 
 
@@ -931,8 +931,6 @@ async def get_mastery_report(
     # Detect book series from TestConfig
     book_series = "power"
     if session.assignment_id:
-        from app.models.test_assignment import TestAssignment
-        from app.models.test_config import TestConfig
         config_result = await db.execute(
             select(TestConfig.book_name)
             .join(TestAssignment, TestAssignment.test_config_id == TestConfig.id)
@@ -955,7 +953,7 @@ async def get_mastery_report(
         book_series=book_series,
     )
 
-    total_word_count = await report_engine.get_total_word_count(db)
+    total_word_count = metrics.total_word_count
 
     session_data = MasterySessionData(
         id=session.id,
@@ -975,18 +973,18 @@ async def get_mastery_report(
     return MasteryReportResponse(
         session=session_data,
         answers=answers_list,
-        radar_metrics=RadarMetrics(**metrics["radar"]),
-        metric_details=[MetricDetail(**d) for d in metrics["metric_details"]],
-        peer_ranking=PeerRanking(**metrics["peer_ranking"]) if metrics["peer_ranking"] else None,
-        grade_level=metrics["grade_level"],
-        vocab_description=metrics["vocab_description"],
-        recommended_book=metrics["recommended_book"],
-        total_time_seconds=metrics["total_time_seconds"] or report_engine.session_duration_seconds(session.started_at, session.completed_at),
+        radar_metrics=RadarMetrics(**metrics.radar),
+        metric_details=[MetricDetail(**d) for d in metrics.metric_details],
+        peer_ranking=PeerRanking(**metrics.peer_ranking) if metrics.peer_ranking else None,
+        grade_level=metrics.grade_level,
+        vocab_description=metrics.vocab_description,
+        recommended_book=metrics.recommended_book,
+        total_time_seconds=metrics.total_time_seconds or report_engine.session_duration_seconds(session.started_at, session.completed_at),
         total_word_count=total_word_count,
         word_summaries=word_summaries,
-        per_engine_stats=[EngineStats(**s) for s in metrics["per_engine_stats"]],
-        diagnosis=EngineDiagnosis(**metrics["diagnosis"]),
-        book_series=metrics.get("book_series", "power"),
+        per_engine_stats=[EngineStats(**s) for s in metrics.per_engine_stats],
+        diagnosis=EngineDiagnosis(**metrics.diagnosis),
+        book_series=metrics.book_series,
     )
 
 
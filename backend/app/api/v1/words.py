@@ -17,7 +17,8 @@ from app.schemas.word import (
 )
 from app.core.deps import CurrentUser, CurrentTeacher
 from app.models.word import Word
-from app.services.question_engines import ENGINES, compute_compatible_engines
+from app.services.question_engines import ENGINE_NAMES, compute_compatible_engines
+from app.services.report_engine import invalidate_word_cache
 
 router = APIRouter(prefix="/words", tags=["words"])
 
@@ -214,7 +215,7 @@ async def compatible_counts_in_range(
     )
     rows = result.scalars().all()
 
-    counts: dict[str, int] = {name: 0 for name in ENGINES}
+    counts: dict[str, int] = {name: 0 for name in ENGINE_NAMES}
     for csv in rows:
         if not csv:
             continue
@@ -238,7 +239,7 @@ async def engine_audit(
     words = result.scalars().all()
 
     total = len(words)
-    engine_names = list(ENGINES.keys())
+    engine_names = list(ENGINE_NAMES)
 
     # Count per-engine coverage
     counts: dict[str, int] = {name: 0 for name in engine_names}
@@ -298,7 +299,7 @@ async def engine_audit_refresh(
     result = await db.execute(select(Word).options(selectinload(Word.examples)))
     words = result.scalars().all()
 
-    engine_names = list(ENGINES.keys())
+    engine_names = list(ENGINE_NAMES)
     counts: dict[str, int] = {name: 0 for name in engine_names}
     updated = 0
 
@@ -350,6 +351,7 @@ async def create_word(
     )
     db.add(new_word)
     await db.commit()
+    invalidate_word_cache()
     await db.refresh(new_word)
     return WordResponse.model_validate(new_word)
 
@@ -377,6 +379,7 @@ async def update_word(
         setattr(word, field, value)
 
     await db.commit()
+    invalidate_word_cache()
     await db.refresh(word)
     return WordResponse.model_validate(word)
 
@@ -399,4 +402,5 @@ async def delete_word(
 
     await db.delete(word)
     await db.commit()
+    invalidate_word_cache()
     return None
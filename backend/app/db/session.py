@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from app.core.config import settings
 
@@ -15,3 +17,14 @@ AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_co
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+@asynccontextmanager
+async def sibling_session(db: AsyncSession):
+    """Open an independent session on the same engine as ``db``.
+
+    AsyncSession can't run statements concurrently, so read-only helpers
+    that are awaited together via asyncio.gather each need their own.
+    """
+    async with AsyncSession(db.bind, expire_on_commit=False) as session:
+        yield session
@@ -46,4 +46,5 @@ class TestSession(Base):
         Index("idx_test_student_id", "student_id"),
         Index("idx_test_completed_at", completed_at.desc()),
         Index("idx_test_type", "test_type"),
+        Index("idx_test_student_completed_score", "student_id", "completed_at", "score"),
     )
@@ -49,4 +49,5 @@ class User(Base):
     __table_args__ = (
         Index("idx_user_teacher_id", "teacher_id"),
         Index("idx_user_role", "role"),
+        Index("idx_user_grade_role", "grade", "role"),
     )
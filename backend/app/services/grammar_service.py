@@ -9,6 +9,7 @@ import httpx
 
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 # ── Seed data ───────────────────────────────────────────────────────────
 
@@ -737,29 +738,37 @@ async def submit_answer(
     time_taken_seconds: Optional[float] = None,
 ) -> dict:
     """Submit a single answer for a grammar question."""
-    session_obj = (await db.execute(
-        select(GrammarSession).where(GrammarSession.id == session_id)
-    )).scalar_one_or_none()
-    if not session_obj:
+    # Session, question, any earlier answer to it and the session's answer
+    # count in one round trip
+    answered_count = (
+        select(func.count())
+        .where(GrammarAnswer.grammar_session_id == GrammarSession.id)
+        .correlate(GrammarSession)
+        .scalar_subquery()
+    )
+    existing_answer = aliased(GrammarAnswer)
+    row = (await db.execute(
+        select(GrammarSession, GrammarQuestion, existing_answer, answered_count)
+        .select_from(GrammarSession)
+        .outerjoin(GrammarQuestion, GrammarQuestion.id == question_id)
+        .outerjoin(
+            existing_answer,
+            and_(
+                existing_answer.grammar_session_id == GrammarSession.id,
+                existing_answer.grammar_question_id == question_id,
+            ),
+        )
+        .where(GrammarSession.id == session_id)
+    )).first()
+    if not row:
         raise ValueError("Session not found")
+    session_obj, question, existing, answered = row
     if session_obj.completed_at:
         raise ValueError("Session already completed")
-
-    question = (await db.execute(
-        select(GrammarQuestion).where(GrammarQuestion.id == question_id)
-    )).scalar_one_or_none()
     if not question:
         raise ValueError("Question not found")
 
     # Check for duplicate answer
-    existing = (await db.execute(
-        select(GrammarAnswer).where(
-            and_(
-                GrammarAnswer.grammar_session_id == session_id,
-                GrammarAnswer.grammar_question_id == question_id,
-            )
-        )
-    )).scalar_one_or_none()
     if existing:
         return {
             "is_correct": existing.is_correct,
@@ -769,13 +778,8 @@ async def submit_answer(
 
     is_correct, correct_answer = await _check_answer(question, selected_answer)
 
-    # Get next question_order
-    count_result = await db.execute(
-        select(func.count()).where(
-            GrammarAnswer.grammar_session_id == session_id
-        )
-    )
-    order = (count_result.scalar() or 0) + 1
+    # Next question_order
+    order = (answered or 0) + 1
 
     answer = GrammarAnswer(
         id=str(uuid.uuid4()),
@@ -8,12 +8,9 @@ import json
 import uuid
 import random
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.word import Word
-from app.models.word_mastery import WordMastery
-from app.models.learning_session import LearningSession
 from app.models.learning_answer import LearningAnswer
 from app.core.timezone import now_kst
 from app.services.question_engines import resolve_name
@@ -26,7 +23,9 @@ from app.services.test_common import (
     check_already_completed,
     find_or_create_session,
     compute_accuracy,
-    mark_assignment_completed,
+    get_session_and_assignment,
+    get_answer_context,
+    complete_assignment,
     check_typing_answer,
     is_typing_question,
     determine_correct_answer,
@@ -147,21 +146,8 @@ async def submit_answer(
     question_type: str | None = None,
 ) -> dict:
     """Submit an answer for a legacy test question. Simple correct/incorrect."""
-    # Look up mastery record
-    mastery_result = await db.execute(
-        select(WordMastery).where(WordMastery.id == word_mastery_id)
-    )
-    mastery = mastery_result.scalar_one_or_none()
-    if not mastery:
-        raise ValueError("Word mastery record not found")
-
-    # Look up word
-    word_result = await db.execute(
-        select(Word).where(Word.id == mastery.word_id)
-    )
-    word = word_result.scalar_one_or_none()
-    if not word:
-        raise ValueError("Word not found")
+    # Mastery record, word and session in one round trip
+    mastery, word, session = await get_answer_context(db, session_id, word_mastery_id)
 
     # Determine correct answer
     correct = determine_correct_answer(word, question_type)
@@ -200,10 +186,6 @@ async def submit_answer(
     db.add(answer)
 
     # Update session counters
-    session_result = await db.execute(
-        select(LearningSession).where(LearningSession.id == session_id)
-    )
-    session = session_result.scalar_one_or_none()
     if session:
         session.words_practiced += 1
         if is_correct and not almost_correct:
@@ -223,12 +205,7 @@ async def complete_session(
     session_id: str,
 ) -> dict:
     """Complete a legacy test session. Simple accuracy scoring."""
-    session_result = await db.execute(
-        select(LearningSession).where(LearningSession.id == session_id)
-    )
-    session = session_result.scalar_one_or_none()
-    if not session:
-        raise ValueError("Session not found")
+    session, assignment = await get_session_and_assignment(db, session_id)
 
     session.completed_at = now_kst()
 
@@ -236,8 +213,7 @@ async def complete_session(
     total_count, correct_count, accuracy = await compute_accuracy(db, session_id)
 
     # Mark assignment completed
-    if session.assignment_id:
-        await mark_assignment_completed(db, session.assignment_id)
+    complete_assignment(assignment)
 
     await db.commit()
 
@@ -259,19 +235,13 @@ async def submit_batch_and_complete(
     await process_batch_answers(db, session_id, answers)
 
     # Complete session
-    session_result = await db.execute(
-        select(LearningSession).where(LearningSession.id == session_id)
-    )
-    session = session_result.scalar_one_or_none()
-    if not session:
-        raise ValueError("Session not found")
+    session, assignment = await get_session_and_assignment(db, session_id)
 
     session.completed_at = now_kst()
 
     total_count, correct_count, accuracy = await compute_accuracy(db, session_id)
 
-    if session.assignment_id:
-        await mark_assignment_completed(db, session.assignment_id)
+    complete_assignment(assignment)
 
     await db.commit()
 
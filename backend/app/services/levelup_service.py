@@ -30,7 +30,9 @@ from app.services.test_common import (
     check_already_completed,
     find_or_create_session,
     compute_accuracy,
-    mark_assignment_completed,
+    get_session_and_assignment,
+    get_answer_context,
+    complete_assignment,
     is_likely_loanword,
     check_typing_answer,
     is_typing_question,
@@ -310,22 +312,10 @@ async def submit_answer(
 
     Simple correct/incorrect check. No stage progression.
     """
-    # Look up mastery record
-    mastery_result = await db.execute(
-        select(WordMastery).where(WordMastery.id == word_mastery_id)
-    )
-    mastery = mastery_result.scalar_one_or_none()
-    if not mastery:
-        raise ValueError("Word mastery record not found")
-
-    # Look up word with examples
-    from sqlalchemy.orm import selectinload
-    word_result = await db.execute(
-        select(Word).options(selectinload(Word.examples)).where(Word.id == mastery.word_id)
+    # Mastery record, word (with examples) and session in one round trip
+    mastery, word, session = await get_answer_context(
+        db, session_id, word_mastery_id, with_examples=True
     )
-    word = word_result.scalar_one_or_none()
-    if not word:
-        raise ValueError("Word not found")
 
     # Determine correct answer
     correct = determine_correct_answer(word, question_type)
@@ -364,10 +354,6 @@ async def submit_answer(
     db.add(answer)
 
     # Update session counters
-    session_result = await db.execute(
-        select(LearningSession).where(LearningSession.id == session_id)
-    )
-    session = session_result.scalar_one_or_none()
     if session:
         session.words_practiced += 1
         if is_correct and not almost_correct:
@@ -402,12 +388,7 @@ async def complete_session(
 
     Persists the frontend-determined final level and computes accuracy.
     """
-    session_result = await db.execute(
-        select(LearningSession).where(LearningSession.id == session_id)
-    )
-    session = session_result.scalar_one_or_none()
-    if not session:
-        raise ValueError("Session not found")
+    session, assignment = await get_session_and_assignment(db, session_id)
 
     # Save final level
     session.current_level = max(1, min(final_level, 15))
@@ -418,8 +399,7 @@ async def complete_session(
     total_count, correct_count, accuracy = await compute_accuracy(db, session_id)
 
     # Mark assignment completed
-    if session.assignment_id:
-        await mark_assignment_completed(db, session.assignment_id)
+    complete_assignment(assignment)
 
     await db.commit()
 
@@ -456,20 +436,14 @@ async def submit_batch_and_complete(
     )
 
     # Complete session
-    session_result = await db.execute(
-        select(LearningSession).where(LearningSession.id == session_id)
-    )
-    session = session_result.scalar_one_or_none()
-    if not session:
-        raise ValueError("Session not found")
+    session, assignment = await get_session_and_assignment(db, session_id)
 
     session.current_level = max(1, min(final_level, 15))
     session.completed_at = now_kst()
 
     total_count, correct_count, accuracy = await compute_accuracy(db, session_id)
 
-    if session.assignment_id:
-        await mark_assignment_completed(db, session.assignment_id)
+    complete_assignment(assignment)
 
     await db.commit()
 
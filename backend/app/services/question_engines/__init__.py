@@ -5,46 +5,70 @@ Usage:
 
     pool = build_pool(all_words)
     engine = get_engine("en_to_ko")
-    if engine.can_generate(word):
-        spec = engine.generate(word, pool)
+    spec = engine.try_generate(word, pool)  # None if the word is unsupported
 """
+import importlib
+
 from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine
-from app.services.question_engines.en_to_ko import EnToKoEngine
-from app.services.question_engines.ko_to_en import KoToEnEngine
-from app.services.question_engines.emoji import EmojiEngine
-from app.services.question_engines.sentence import SentenceEngine, apply_sentence_overlay, make_sentence_blank
-from app.services.question_engines.listen_en import ListenEnEngine
-from app.services.question_engines.listen_ko import ListenKoEngine
-from app.services.question_engines.listen_type import ListenTypeEngine
-from app.services.question_engines.ko_type import KoTypeEngine
-from app.services.question_engines.antonym_type import AntonymTypeEngine
-from app.services.question_engines.antonym_choice import AntonymChoiceEngine
-from app.services.question_engines.sentence_type import SentenceTypeEngine
-from app.services.question_engines.distractors import (
-    pick_korean_distractors,
-    pick_english_distractors,
-    shuffle_choices,
-)
 
 from app.models.word import Word
 
 
-# ── Engine instances ─────────────────────────────────────────────────────────
-
-ENGINES: dict[str, QuestionEngine] = {
-    "en_to_ko": EnToKoEngine(),
-    "ko_to_en": KoToEnEngine(),
-    "emoji": EmojiEngine(),
-    "sentence": SentenceEngine(),
-    "listen_en": ListenEnEngine(),
-    "listen_ko": ListenKoEngine(),
-    "listen_type": ListenTypeEngine(),
-    "ko_type": KoTypeEngine(),
-    "antonym_type": AntonymTypeEngine(),
-    "antonym_choice": AntonymChoiceEngine(),
-    "sentence_type": SentenceTypeEngine(),
+# ── Engine registry ─────────────────────────────────────────────────────────
+# Engine modules are imported on first use, so callers that only need one
+# engine (or only the name maps below) don't pay for the rest.
+
+_ENGINE_MODULES: dict[str, tuple[str, str]] = {
+    "en_to_ko": ("app.services.question_engines.en_to_ko", "EnToKoEngine"),
+    "ko_to_en": ("app.services.question_engines.ko_to_en", "KoToEnEngine"),
+    "emoji": ("app.services.question_engines.emoji", "EmojiEngine"),
+    "sentence": ("app.services.question_engines.sentence", "SentenceEngine"),
+    "listen_en": ("app.services.question_engines.listen_en", "ListenEnEngine"),
+    "listen_ko": ("app.services.question_engines.listen_ko", "ListenKoEngine"),
+    "listen_type": ("app.services.question_engines.listen_type", "ListenTypeEngine"),
+    "ko_type": ("app.services.question_engines.ko_type", "KoTypeEngine"),
+    "antonym_type": ("app.services.question_engines.antonym_type", "AntonymTypeEngine"),
+    "antonym_choice": ("app.services.question_engines.antonym_choice", "AntonymChoiceEngine"),
+    "sentence_type": ("app.services.question_engines.sentence_type", "SentenceTypeEngine"),
 }
 
+ENGINE_NAMES: tuple[str, ...] = tuple(_ENGINE_MODULES)
+
+# Helpers re-exported from submodules, also resolved lazily.
+_LAZY_EXPORTS: dict[str, str] = {
+    "apply_sentence_overlay": "app.services.question_engines.sentence",
+    "make_sentence_blank": "app.services.question_engines.sentence",
+    "pick_korean_distractors": "app.services.question_engines.distractors",
+    "pick_english_distractors": "app.services.question_engines.distractors",
+    "shuffle_choices": "app.services.question_engines.distractors",
+    **{cls: module for module, cls in _ENGINE_MODULES.values()},
+}
+
+_engine_instances: dict[str, QuestionEngine] = {}
+
+
+def _load_engine(canonical: str) -> QuestionEngine:
+    """Import and instantiate an engine on first use; cached afterwards."""
+    engine = _engine_instances.get(canonical)
+    if engine is None:
+        module_path, class_name = _ENGINE_MODULES[canonical]
+        engine = getattr(importlib.import_module(module_path), class_name)()
+        _engine_instances[canonical] = engine
+    return engine
+
+
+def __getattr__(name: str):
+    if name == "ENGINES":
+        engines = {n: _load_engine(n) for n in ENGINE_NAMES}
+        globals()["ENGINES"] = engines
+        return engines
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
 # ── Legacy Name Mapping ─────────────────────────────────────────────────────
 # Maps old question type names → canonical engine names.
@@ -106,14 +130,14 @@ def resolve_name(name: str) -> str:
 def get_engine(name: str) -> QuestionEngine:
     """Get engine by canonical or legacy name. Raises KeyError if not found."""
     canonical = resolve_name(name)
-    if canonical not in ENGINES:
+    if canonical not in _ENGINE_MODULES:
         raise KeyError(f"Unknown question engine: {name!r} (resolved: {canonical!r})")
-    return ENGINES[canonical]
+    return _load_engine(canonical)
 
 
 def compute_compatible_engines(word: Word) -> list[str]:
     """Return list of canonical engine names compatible with the given word."""
-    return [name for name, engine in ENGINES.items() if engine.can_generate(word)]
+    return [name for name in ENGINE_NAMES if _load_engine(name).can_generate(word)]
 
 
 def build_pool(all_words: list[Word]) -> DistractorPool:
@@ -137,6 +161,7 @@ def to_mastery_name(canonical: str) -> str:
 
 __all__ = [
     "ENGINES",
+    "ENGINE_NAMES",
     "LEGACY_NAME_MAP",
     "CANONICAL_TO_LEVEL",
     "CANONICAL_TO_MASTERY",
@@ -5,15 +5,16 @@ Mastery name    : antonym_and_choice
 Card            : AntonymCard + ChoiceButton
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine
 from app.services.question_engines.distractors import (
     pick_english_distractors,
     shuffle_choices,
 )
 
 
-class AntonymChoiceEngine:
+class AntonymChoiceEngine(QuestionEngine):
     question_type = "antonym_choice"
+    required_flags = ("antonym",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(word.antonym)
@@ -24,7 +25,26 @@ class AntonymChoiceEngine:
         pool: DistractorPool,
         n_choices: int = 4,
     ) -> QuestionSpec:
+        return self._build(word, pool, word.antonym, n_choices)
+
+    def try_generate(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        n_choices: int = 4,
+    ) -> QuestionSpec | None:
         antonym = word.antonym
+        if not antonym:
+            return None
+        return self._build(word, pool, antonym, n_choices)
+
+    def _build(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        antonym: str,
+        n_choices: int,
+    ) -> QuestionSpec:
         distractors = pick_english_distractors(
             antonym, pool, count=n_choices - 1, source_word=word
         )
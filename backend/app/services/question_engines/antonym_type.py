@@ -5,11 +5,12 @@ Mastery name    : antonym_and_type
 Card            : AntonymCard + TypingInput
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool, make_typing_hint, clean_english_for_typing
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine, make_typing_hint, clean_english_for_typing
 
 
-class AntonymTypeEngine:
+class AntonymTypeEngine(QuestionEngine):
     question_type = "antonym_type"
+    required_flags = ("antonym",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(word.antonym)
@@ -20,12 +21,25 @@ class AntonymTypeEngine:
         pool: DistractorPool,
         n_choices: int = 4,
     ) -> QuestionSpec:
-        antonym = clean_english_for_typing(word.antonym or '')
+        return self._build(word, word.antonym or '')
+
+    def try_generate(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        n_choices: int = 4,
+    ) -> QuestionSpec | None:
+        antonym = word.antonym
+        if not antonym:
+            return None
+        return self._build(word, antonym)
+
+    def _build(self, word: Word, antonym: str) -> QuestionSpec:
         return QuestionSpec(
             question_type=self.question_type,
             word=word,
-            correct_answer=antonym,
+            correct_answer=clean_english_for_typing(antonym),
             choices=None,
             is_typing=True,
-            hint=make_typing_hint(word.antonym or ''),
+            hint=make_typing_hint(antonym),
         )
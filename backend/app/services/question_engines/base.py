@@ -8,11 +8,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Protocol, runtime_checkable
 
 from app.models.word import Word
 
 
+@lru_cache(maxsize=8192)
 def clean_english_for_typing(text: str) -> str:
     """Strip annotations (~, ..., parenthesized, quoted) from English text for typing questions."""
     cleaned = re.sub(r'\(.*?\)', '', text)
@@ -22,7 +24,7 @@ def clean_english_for_typing(text: str) -> str:
     return cleaned
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionSpec:
     """Unified question output, engine-agnostic."""
 
@@ -39,6 +41,7 @@ class QuestionSpec:
     hint: str | None = None          # first-letter hint for typing questions
 
 
+@lru_cache(maxsize=8192)
 def make_typing_hint(word: str) -> str | None:
     """Generate typing hint: first letter of each word + underscores.
 
@@ -49,18 +52,22 @@ def make_typing_hint(word: str) -> str | None:
     """
     if not word:
         return None
-    cleaned = clean_english_for_typing(word)
+    return _hint_from_clean(clean_english_for_typing(word))
+
+
+@lru_cache(maxsize=8192)
+def _hint_from_clean(cleaned: str) -> str | None:
+    """make_typing_hint for text already passed through clean_english_for_typing.
+
+    Typing engines clean the answer anyway, so they hint from that string
+    instead of cleaning the word a second time.
+    """
     if not cleaned:
         return None
-    parts = cleaned.split(' ')
-    hint_parts = []
-    for part in parts:
-        if part:
-            hint_parts.append(part[0] + '_' * (len(part) - 1))
-    return ' '.join(hint_parts)
+    return ' '.join(part[0] + '_' * (len(part) - 1) for part in cleaned.split(' ') if part)
 
 
-@dataclass
+@dataclass(slots=True)
 class DistractorPool:
     """Pre-computed pools for distractor generation.
 
@@ -70,6 +77,29 @@ class DistractorPool:
     all_korean: list[str] = field(default_factory=list)   # unique korean meanings
     all_english: list[str] = field(default_factory=list)   # unique english words
     all_words: list[Word] = field(default_factory=list)    # full word list
+    # Derived in __post_init__ so distractor pickers test membership instead
+    # of re-scanning the same strings for every question.
+    tilde_korean: frozenset[str] = field(init=False, repr=False, compare=False)    # meanings starting with ~
+    phrase_english: frozenset[str] = field(init=False, repr=False, compare=False)  # multi-word entries
+    level_indices: dict[int, list[int]] = field(init=False, repr=False, compare=False)  # all_words positions per level, ascending
+    # Ranked distractor candidates per (kind, correct, level, POS, tier, count),
+    # filled lazily so engines generating for the same word share one scan.
+    tier_cache: dict[tuple, list] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Imported here so loading the package doesn't pull in the pickers
+        from app.services.question_engines.distractors import has_tilde, is_phrase
+
+        korean = set(self.all_korean)
+        korean.update(w.korean for w in self.all_words if w.korean)
+        english = set(self.all_english)
+        english.update(w.english for w in self.all_words if w.english)
+        self.tilde_korean = frozenset(k for k in korean if has_tilde(k))
+        self.phrase_english = frozenset(e for e in english if is_phrase(e))
+        by_level: dict[int, list[int]] = {}
+        for i, w in enumerate(self.all_words):
+            by_level.setdefault(w.level, []).append(i)
+        self.level_indices = by_level
 
 
 @runtime_checkable
@@ -77,6 +107,9 @@ class QuestionEngine(Protocol):
     """Protocol for per-type question engines."""
 
     question_type: str
+    # Word features can_generate depends on. Engines declaring the same flags
+    # accept the same words, so reports evaluate each distinct set once.
+    required_flags: tuple[str, ...] = ()
 
     def can_generate(self, word: Word) -> bool:
         """Return True if this engine can generate a question for the given word."""
@@ -90,3 +123,19 @@ class QuestionEngine(Protocol):
     ) -> QuestionSpec:
         """Generate a single question for the given word."""
         ...
+
+    def try_generate(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        n_choices: int = 4,
+    ) -> QuestionSpec | None:
+        """Generate a question, or return None if the word is not supported.
+
+        Fuses can_generate + generate so callers read word attributes once.
+        Engines subclassing this protocol inherit the two-step fallback and
+        override it when the eligibility check and generation share work.
+        """
+        if not self.can_generate(word):
+            return None
+        return self.generate(word, pool, n_choices)
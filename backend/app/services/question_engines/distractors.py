@@ -4,7 +4,10 @@ Smart distractor selection: picks wrong answers that are
 1. From similar difficulty level and POS (tier-based)
 2. Most confusing / similar to the correct answer (scored ranking)
 """
+import functools
+import heapq
 import random
+import threading
 from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
@@ -12,6 +15,21 @@ if TYPE_CHECKING:
     from app.services.question_engines.base import DistractorPool
 
 
+_rng_local = threading.local()
+
+
+def _get_rng() -> random.Random:
+    """Return this thread's Random instance (created on first use).
+
+    Keeps distractor sampling off the shared module-level generator, which
+    other code may reseed.
+    """
+    rng = getattr(_rng_local, "rng", None)
+    if rng is None:
+        rng = _rng_local.rng = random.Random()
+    return rng
+
+
 def is_phrase(text: str) -> bool:
     """Check if a word entry is a phrase/idiom (contains spaces)."""
     return ' ' in text.strip()
@@ -69,6 +87,83 @@ _EN_SUFFIXES = (
 _KO_SUFFIXES = ('하다', '되다', '시키다', '적인', '적', '스럽다', '롭다')
 
 
+def _make_english_scorer(correct: str) -> Callable[[str], float]:
+    """Build a confusion scorer for English distractors of `correct`.
+
+    The target's features (lowercased form, first letter, length, matching
+    suffixes, last 2 chars) are computed once and closed over, so scoring
+    each candidate only does candidate-side work. Higher = more confusing.
+    """
+    t = correct.lower().strip()
+    if not t:
+        return lambda candidate: 0.0
+    t_first = t[0]
+    t_len = len(t)
+    t_last2 = t[-2:] if t_len >= 2 else None
+    t_suffixes = tuple(sfx for sfx in _EN_SUFFIXES if t.endswith(sfx))
+
+    def score(candidate: str) -> float:
+        c = candidate.lower().strip()
+        if not c:
+            return 0.0
+        s = 0.0
+        # Same first letter — very confusing at a glance
+        if c[0] == t_first:
+            s += 3
+        # Similar length (±1: +3, ±2: +1)
+        len_diff = abs(len(c) - t_len)
+        if len_diff <= 1:
+            s += 3
+        elif len_diff <= 2:
+            s += 1
+        # Same ending pattern (e.g. -tion, -ly, -ment)
+        if t_suffixes and c.endswith(t_suffixes):
+            s += 2
+        # Same last 2 characters (rhyme-like)
+        if t_last2 and len(c) >= 2 and c[-2:] == t_last2:
+            s += 1
+        return s
+
+    return score
+
+
+def _make_korean_scorer(correct: str) -> Callable[[str], float]:
+    """Build a confusion scorer for Korean distractors of `correct`.
+
+    Same idea as _make_english_scorer: tilde-stripped target, its length,
+    matching endings and first syllable are computed once. Higher = more confusing.
+    """
+    t_clean = correct.strip().lstrip('~').strip()
+    if not correct.strip():
+        return lambda candidate: 0.0
+    t_len = len(t_clean)
+    t_first = t_clean[0] if t_clean else None
+    t_suffixes = tuple(sfx for sfx in _KO_SUFFIXES if t_clean.endswith(sfx))
+
+    def score(candidate: str) -> float:
+        c = candidate.strip()
+        if not c:
+            return 0.0
+        # Strip tilde for comparison
+        c_clean = c.lstrip('~').strip()
+        s = 0.0
+        # Similar length (±1: +3, ±2: +1)
+        len_diff = abs(len(c_clean) - t_len)
+        if len_diff <= 1:
+            s += 3
+        elif len_diff <= 2:
+            s += 1
+        # Same ending pattern (verb/adj endings)
+        if t_suffixes and c_clean.endswith(t_suffixes):
+            s += 3
+        # Same first syllable — similar semantic category feel
+        if t_first and c_clean and c_clean[0] == t_first:
+            s += 2
+        return s
+
+    return score
+
+
 def _english_confusion_score(candidate: str, correct: str) -> float:
     """Score how confusing an English distractor is. Higher = more confusing."""
     score = 0.0
@@ -122,27 +217,146 @@ def _korean_confusion_score(candidate: str, correct: str) -> float:
     return score
 
 
-def _pick_confusing(
+def _rank_confusing(
     candidates: list[str],
-    correct: str,
     count: int,
-    scorer: Callable[[str, str], float],
+    scorer: Callable[[str], float],
 ) -> list[str]:
-    """Pick most confusing distractors from candidates.
+    """Deduplicate candidates and keep the most confusing top pool.
 
-    Scores all candidates by confusion similarity, takes the top pool
-    (2x needed), then random-samples from that pool for variety.
+    The top pool is 2x needed (or count+5), so callers can random-sample
+    from it for variety. Returns all unique candidates if there are too few.
     """
     unique = list(dict.fromkeys(candidates))  # preserve order, deduplicate
     if len(unique) <= count:
-        random.shuffle(unique)
         return unique
-    scored = [(c, scorer(c, correct)) for c in unique]
-    scored.sort(key=lambda x: -x[1])
+    ranked = sorted(unique, key=scorer, reverse=True)  # stable for ties
     # Take top pool: 2x count or count+5, capped at available
-    top_k = min(max(count * 2, count + 5), len(scored))
-    top = [c for c, _ in scored[:top_k]]
-    return random.sample(top, count)
+    top_k = min(max(count * 2, count + 5), len(ranked))
+    return ranked[:top_k]
+
+
+def _sample_ranked(top: list[str], count: int) -> list[str]:
+    """Random-sample `count` picks from a ranked top pool (never mutates it)."""
+    if len(top) <= count:
+        picks = list(top)
+        _get_rng().shuffle(picks)
+        return picks
+    return _get_rng().sample(top, count)
+
+
+def _pick_confusing(
+    candidates: list[str],
+    count: int,
+    scorer: Callable[[str], float],
+) -> list[str]:
+    """Pick most confusing distractors from candidates.
+
+    Scores all candidates by confusion similarity, takes the top pool
+    (2x needed), then random-samples from that pool for variety.
+    """
+    return _sample_ranked(_rank_confusing(candidates, count, scorer), count)
+
+
+def _pick_cached(
+    pool: "DistractorPool",
+    key: tuple,
+    build: Callable[[], list[str]],
+    count: int,
+    scorer: Callable[[str], float],
+) -> list[str]:
+    """_pick_confusing over a tier whose ranked top pool is cached on the pool.
+
+    Only the random sample is redone per call, so e.g. en_to_ko and listen_ko
+    generating for the same word in one batch share the tier scan and scoring.
+    """
+    top = pool.tier_cache.get(key)
+    if top is None:
+        top = pool.tier_cache[key] = _rank_confusing(build(), count, scorer)
+    return _sample_ranked(top, count)
+
+
+def _words_near_level(pool: "DistractorPool", level: int, k: int) -> list["Word"]:
+    """Words within +/-k levels of `level`, read from the pool's level buckets.
+
+    The buckets' indices are merged so words keep their pool order, which
+    _rank_confusing relies on to break score ties.
+    """
+    by_level = pool.level_indices
+    words = pool.all_words
+    buckets = [by_level[lv] for lv in range(level - k, level + k + 1) if lv in by_level]
+    return [words[i] for i in heapq.merge(*buckets)]
+
+
+# Candidate tiers for the word-aware pickers, tried in order until one has
+# enough candidates: (level radius or None for the whole pool, same POS,
+# same pattern). Tiers 1-3 read only the level buckets they cover.
+_DISTRACTOR_TIERS: tuple[tuple[int | None, bool, bool], ...] = (
+    (1, True, True),        # 1. Same level +/-1, same POS, same pattern
+    (2, False, True),       # 2. Same level +/-2, same pattern
+    (3, False, True),       # 3. Same level +/-3, same pattern
+    (None, False, True),    # 4. Any word with same pattern
+    (None, False, False),   # 5. Any word
+)
+
+
+def _tier_candidates(
+    pool: "DistractorPool",
+    field: str,
+    correct: str,
+    pattern: frozenset[str],
+    correct_in_pattern: bool,
+    source_word: "Word",
+    radius: int | None,
+    same_pos: bool,
+    same_pattern: bool,
+) -> list[str]:
+    """`field` values of one tier's words that may serve as distractors."""
+    words = pool.all_words if radius is None else _words_near_level(pool, source_word.level, radius)
+    target_pos = source_word.part_of_speech
+    candidates = []
+    for w in words:
+        if same_pos and w.part_of_speech != target_pos:
+            continue
+        value = getattr(w, field)
+        if not value or value == correct:
+            continue
+        if same_pattern and (value in pattern) != correct_in_pattern:
+            continue
+        if _is_too_similar(value, correct):
+            continue
+        candidates.append(value)
+    return candidates
+
+
+def _pick_tiered(
+    pool: "DistractorPool",
+    field: str,
+    correct: str,
+    count: int,
+    scorer: Callable[[str], float],
+    pattern: frozenset[str],
+    correct_in_pattern: bool,
+    source_word: "Word",
+) -> list[str]:
+    """Walk _DISTRACTOR_TIERS for `field` ("korean" or "english") distractors.
+
+    Returns the first tier's picks with at least `count` entries, or the
+    last tier's picks. Tier 1 is skipped when the word has no POS.
+    """
+    key = (field, correct, source_word.level, source_word.part_of_speech, count)
+    result: list[str] = []
+    for tier, (radius, same_pos, same_pattern) in enumerate(_DISTRACTOR_TIERS, 1):
+        if same_pos and not source_word.part_of_speech:
+            continue
+        build = functools.partial(
+            _tier_candidates, pool, field, correct, pattern, correct_in_pattern,
+            source_word, radius, same_pos, same_pattern,
+        )
+        result = _pick_cached(pool, key + (tier,), build, count, scorer)
+        if len(result) >= count:
+            return result
+    return result
 
 
 def pick_korean_distractors(
@@ -165,58 +379,21 @@ def pick_korean_distractors(
     (similar length, same ending pattern, same first syllable).
     """
     correct_has_tilde = has_tilde(correct)
-    scorer = _korean_confusion_score
+    tilde = pool.tilde_korean
+    scorer = _make_korean_scorer(correct)
 
     # No word info -> legacy flat behavior
     if not source_word or not pool.all_words:
-        same_type = [k for k in pool.all_korean if k != correct and not _is_too_similar(k, correct) and has_tilde(k) == correct_has_tilde]
+        same_type = [k for k in pool.all_korean if k != correct and not _is_too_similar(k, correct) and (k in tilde) == correct_has_tilde]
         if len(same_type) >= count:
-            return _pick_confusing(same_type, correct, count, scorer)
-        other = [k for k in pool.all_korean if k != correct and not _is_too_similar(k, correct) and has_tilde(k) != correct_has_tilde]
+            return _pick_confusing(same_type, count, scorer)
+        other = [k for k in pool.all_korean if k != correct and not _is_too_similar(k, correct) and (k in tilde) != correct_has_tilde]
         combined = same_type + other
-        return _pick_confusing(combined, correct, min(count, len(combined)), scorer)
+        return _pick_confusing(combined, min(count, len(combined)), scorer)
 
-    target_level = source_word.level
-    target_pos = source_word.part_of_speech
-
-    # Build base candidates: different word, same tilde pattern, not too similar
-    base = [
-        w for w in pool.all_words
-        if w.korean and w.korean != correct
-        and not _is_too_similar(w.korean, correct)
-        and has_tilde(w.korean) == correct_has_tilde
-    ]
-
-    # Tier 1: Same level +/-1, same POS
-    if target_pos:
-        tier1 = [w.korean for w in base
-                 if abs(w.level - target_level) <= 1 and w.part_of_speech == target_pos]
-        result = _pick_confusing(tier1, correct, count, scorer)
-        if len(result) >= count:
-            return result
-
-    # Tier 2: Same level +/-2
-    tier2 = [w.korean for w in base if abs(w.level - target_level) <= 2]
-    result = _pick_confusing(tier2, correct, count, scorer)
-    if len(result) >= count:
-        return result
-
-    # Tier 3: Same level +/-3
-    tier3 = [w.korean for w in base if abs(w.level - target_level) <= 3]
-    result = _pick_confusing(tier3, correct, count, scorer)
-    if len(result) >= count:
-        return result
-
-    # Tier 4: Any word with same tilde pattern
-    tier4 = [w.korean for w in base]
-    result = _pick_confusing(tier4, correct, count, scorer)
-    if len(result) >= count:
-        return result
-
-    # Tier 5: Any word (ignore tilde pattern)
-    all_candidates = [w.korean for w in pool.all_words if w.korean and w.korean != correct and not _is_too_similar(w.korean, correct)]
-    result = _pick_confusing(all_candidates, correct, count, scorer)
-    return result
+    return _pick_tiered(
+        pool, "korean", correct, count, scorer, tilde, correct_has_tilde, source_word
+    )
 
 
 def pick_english_distractors(
@@ -239,62 +416,29 @@ def pick_english_distractors(
     (same first letter, similar length, same suffix pattern).
     """
     is_correct_phrase = is_phrase(correct)
-    scorer = _english_confusion_score
+    phrases = pool.phrase_english
+    scorer = _make_english_scorer(correct)
 
     # No word info -> legacy flat behavior
     if not source_word or not pool.all_words:
-        same_type = [e for e in pool.all_english if e != correct and not _is_too_similar(e, correct) and is_phrase(e) == is_correct_phrase]
+        same_type = [e for e in pool.all_english if e != correct and not _is_too_similar(e, correct) and (e in phrases) == is_correct_phrase]
         if len(same_type) >= count:
-            return _pick_confusing(same_type, correct, count, scorer)
-        other = [e for e in pool.all_english if e != correct and not _is_too_similar(e, correct) and is_phrase(e) != is_correct_phrase]
+            return _pick_confusing(same_type, count, scorer)
+        other = [e for e in pool.all_english if e != correct and not _is_too_similar(e, correct) and (e in phrases) != is_correct_phrase]
         combined = same_type + other
-        return _pick_confusing(combined, correct, min(count, len(combined)), scorer)
+        return _pick_confusing(combined, min(count, len(combined)), scorer)
 
-    target_level = source_word.level
-    target_pos = source_word.part_of_speech
-
-    # Build base candidates: different word, same phrase pattern, not too similar
-    base = [
-        w for w in pool.all_words
-        if w.english and w.english != correct
-        and not _is_too_similar(w.english, correct)
-        and is_phrase(w.english) == is_correct_phrase
-    ]
-
-    # Tier 1: Same level +/-1, same POS
-    if target_pos:
-        tier1 = [w.english for w in base
-                 if abs(w.level - target_level) <= 1 and w.part_of_speech == target_pos]
-        result = _pick_confusing(tier1, correct, count, scorer)
-        if len(result) >= count:
-            return result
-
-    # Tier 2: Same level +/-2
-    tier2 = [w.english for w in base if abs(w.level - target_level) <= 2]
-    result = _pick_confusing(tier2, correct, count, scorer)
-    if len(result) >= count:
-        return result
-
-    # Tier 3: Same level +/-3
-    tier3 = [w.english for w in base if abs(w.level - target_level) <= 3]
-    result = _pick_confusing(tier3, correct, count, scorer)
-    if len(result) >= count:
-        return result
-
-    # Tier 4: Any word with same phrase pattern
-    tier4 = [w.english for w in base]
-    result = _pick_confusing(tier4, correct, count, scorer)
-    if len(result) >= count:
-        return result
-
-    # Tier 5: Any word (ignore phrase pattern)
-    all_candidates = [w.english for w in pool.all_words if w.english and w.english != correct and not _is_too_similar(w.english, correct)]
-    result = _pick_confusing(all_candidates, correct, count, scorer)
-    return result
+    return _pick_tiered(
+        pool, "english", correct, count, scorer, phrases, is_correct_phrase, source_word
+    )
 
 
 def shuffle_choices(correct: str, distractors: list[str]) -> list[str]:
-    """Combine correct answer with distractors and shuffle."""
-    choices = [correct] + distractors
-    random.shuffle(choices)
+    """Combine correct answer with distractors and shuffle.
+
+    Distractor pickers already return their picks in random order, so only
+    the correct answer's slot needs to be drawn (one RNG call, not a shuffle).
+    """
+    choices = list(distractors)
+    choices.insert(_get_rng().randrange(len(choices) + 1), correct)
     return choices
@@ -5,13 +5,14 @@ Mastery name    : emoji_to_word
 Card            : EmojiCard
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine
 from app.services.emoji_engine import get_emoji, get_emoji_distractors
 from app.services.question_engines.distractors import shuffle_choices
 
 
-class EmojiEngine:
+class EmojiEngine(QuestionEngine):
     question_type = "emoji"
+    required_flags = ("emoji",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(get_emoji(word.english, word.korean))
@@ -22,7 +23,26 @@ class EmojiEngine:
         pool: DistractorPool,
         n_choices: int = 4,
     ) -> QuestionSpec:
+        return self._build(word, pool, get_emoji(word.english, word.korean), n_choices)
+
+    def try_generate(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        n_choices: int = 4,
+    ) -> QuestionSpec | None:
         emoji = get_emoji(word.english, word.korean)
+        if not emoji:
+            return None
+        return self._build(word, pool, emoji, n_choices)
+
+    def _build(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        emoji: str | None,
+        n_choices: int,
+    ) -> QuestionSpec:
         correct = word.english
         distractors = get_emoji_distractors(correct, pool.all_english, n_choices - 1)
         return QuestionSpec(
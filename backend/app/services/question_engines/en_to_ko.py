@@ -5,12 +5,13 @@ Mastery name    : word_to_meaning
 Card            : WordCard (or SentenceCard in sentence mode)
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine
 from app.services.question_engines.distractors import pick_korean_distractors, shuffle_choices
 
 
-class EnToKoEngine:
+class EnToKoEngine(QuestionEngine):
     question_type = "en_to_ko"
+    required_flags = ("korean",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(word.korean)
@@ -5,12 +5,13 @@ Mastery name    : meaning_to_word
 Card            : MeaningCard (or SentenceCard in sentence mode)
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine
 from app.services.question_engines.distractors import pick_english_distractors, shuffle_choices
 
 
-class KoToEnEngine:
+class KoToEnEngine(QuestionEngine):
     question_type = "ko_to_en"
+    required_flags = ("korean",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(word.korean)
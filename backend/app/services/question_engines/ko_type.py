@@ -5,11 +5,12 @@ Mastery name    : meaning_and_type
 Card            : MeaningCard + TypingInput
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool, make_typing_hint, clean_english_for_typing
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine, make_typing_hint, clean_english_for_typing
 
 
-class KoTypeEngine:
+class KoTypeEngine(QuestionEngine):
     question_type = "ko_type"
+    required_flags = ("korean",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(word.korean)
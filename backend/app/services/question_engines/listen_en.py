@@ -5,12 +5,13 @@ Mastery name    : (N/A - mastery uses listen_and_type or listen_to_meaning)
 Card            : ListeningCard
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine
 from app.services.question_engines.distractors import pick_english_distractors, shuffle_choices
 
 
-class ListenEnEngine:
+class ListenEnEngine(QuestionEngine):
     question_type = "listen_en"
+    required_flags = ("english",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(word.english)
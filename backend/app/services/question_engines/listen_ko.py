@@ -5,12 +5,13 @@ Mastery name    : listen_to_meaning
 Card            : ListeningCard (choices are Korean)
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine
 from app.services.question_engines.distractors import pick_korean_distractors, shuffle_choices
 
 
-class ListenKoEngine:
+class ListenKoEngine(QuestionEngine):
     question_type = "listen_ko"
+    required_flags = ("korean",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(word.korean)
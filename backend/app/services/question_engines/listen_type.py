@@ -5,11 +5,12 @@ Mastery name    : listen_and_type
 Card            : ListeningCard + TypingInput
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool, make_typing_hint, clean_english_for_typing
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine, make_typing_hint, clean_english_for_typing
 
 
-class ListenTypeEngine:
+class ListenTypeEngine(QuestionEngine):
     question_type = "listen_type"
+    required_flags = ("english",)
 
     def can_generate(self, word: Word) -> bool:
         return bool(word.english)
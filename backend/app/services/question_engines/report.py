@@ -8,19 +8,24 @@ Analyzes the word pool against each question engine to produce:
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from itertools import compress, islice
+from types import MappingProxyType
 
 from app.models.word import Word
-from app.services.question_engines.base import DistractorPool
+from app.services.question_engines.base import DistractorPool, QuestionEngine
 from app.services.question_engines import (
     ENGINES,
+    ENGINE_NAMES,
     CANONICAL_TO_LEVEL,
     CANONICAL_TO_MASTERY,
-    build_pool,
+    LEGACY_NAME_MAP,
 )
+from app.services.question_engines.sentence import sentence_eligibility
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineReport:
     """Report for a single engine."""
     canonical_name: str
@@ -37,7 +42,7 @@ class EngineReport:
     sample_words: list[str]    # up to 5 sample eligible words
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolHealthReport:
     """Health metrics for the distractor pool."""
     total_words: int
@@ -47,20 +52,20 @@ class PoolHealthReport:
     example_coverage_pct: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConsumerUsage:
     """Which engines each test consumer uses."""
-    consumer: str              # "Level Test" | "Mastery (Stage)" | "Mastery (Mixed)" etc.
-    engines_used: list[str]    # canonical engine names
+    consumer: str                   # "Level Test" | "Mastery (Stage)" | "Mastery (Mixed)" etc.
+    engines_used: tuple[str, ...]   # canonical engine names
 
 
-@dataclass
+@dataclass(slots=True)
 class FullReport:
     """Complete question engine system report."""
     engine_reports: list[EngineReport]
     pool_health: PoolHealthReport
-    consumer_usages: list[ConsumerUsage]
-    legacy_mapping: dict[str, str]   # legacy name -> canonical
+    consumer_usages: tuple[ConsumerUsage, ...]
+    legacy_mapping: Mapping[str, str]   # legacy name -> canonical (read-only view)
 
 
 # ── Engine metadata ──────────────────────────────────────────────────────────
@@ -128,148 +133,191 @@ _ENGINE_META: dict[str, dict] = {
     },
 }
 
-_CONSUMER_USAGES = [
+_TYPING_ENGINES = frozenset({"listen_type", "ko_type", "antonym_type"})
+
+# Static EngineReport columns per engine, resolved once at import:
+# (korean_name, description, level_test_name, mastery_name, card, direction, is_typing)
+_ENGINE_ROW: dict[str, tuple[str, str, str, str, str, str, bool]] = {
+    name: (
+        meta.get("korean_name", ""),
+        meta.get("description", ""),
+        CANONICAL_TO_LEVEL.get(name, "N/A"),
+        CANONICAL_TO_MASTERY.get(name, "N/A"),
+        meta.get("card", ""),
+        meta.get("direction", ""),
+        name in _TYPING_ENGINES,
+    )
+    for name in ENGINE_NAMES
+    for meta in (_ENGINE_META.get(name, {}),)
+}
+
+_CONSUMER_USAGES = (
     ConsumerUsage(
         consumer="Level Test (placement)",
-        engines_used=["en_to_ko", "ko_to_en", "emoji", "sentence", "listen_en"],
+        engines_used=("en_to_ko", "ko_to_en", "emoji", "sentence", "listen_en"),
     ),
     ConsumerUsage(
         consumer="Mastery Stage Test (stage 1)",
-        engines_used=["en_to_ko", "emoji"],
+        engines_used=("en_to_ko", "emoji"),
     ),
     ConsumerUsage(
         consumer="Mastery Stage Test (stage 2)",
-        engines_used=["ko_to_en", "emoji"],
+        engines_used=("ko_to_en", "emoji"),
     ),
     ConsumerUsage(
         consumer="Mastery Stage Test (stage 3)",
-        engines_used=["listen_type"],
+        engines_used=("listen_type",),
     ),
     ConsumerUsage(
         consumer="Mastery Stage Test (stage 4)",
-        engines_used=["listen_ko"],
+        engines_used=("listen_ko",),
     ),
     ConsumerUsage(
         consumer="Mastery Stage Test (stage 5)",
-        engines_used=["ko_type"],
+        engines_used=("ko_type",),
     ),
     ConsumerUsage(
         consumer="Mastery Mixed (adaptive)",
-        engines_used=["en_to_ko", "ko_to_en", "emoji", "sentence", "listen_type", "listen_ko", "ko_type"],
+        engines_used=("en_to_ko", "ko_to_en", "emoji", "sentence", "listen_type", "listen_ko", "ko_type"),
     ),
     ConsumerUsage(
         consumer="Mastery Word-only",
-        engines_used=["en_to_ko", "ko_to_en", "sentence"],
+        engines_used=("en_to_ko", "ko_to_en", "sentence"),
     ),
     ConsumerUsage(
         consumer="Mastery Listen-only",
-        engines_used=["listen_type", "listen_ko"],
+        engines_used=("listen_type", "listen_ko"),
     ),
     ConsumerUsage(
         consumer="Listening Engine (legacy)",
-        engines_used=["listen_en"],
+        engines_used=("listen_en",),
     ),
-]
+)
+
+# Shared read-only view; reports don't copy the registry map.
+_LEGACY_MAPPING_VIEW = MappingProxyType(LEGACY_NAME_MAP)
+
+
+def _score_engine(
+    engine: QuestionEngine,
+    words: list[Word],
+    scores: dict[tuple[str, ...], tuple[int, list[str]]],
+) -> tuple[int, list[str]]:
+    """Return (eligible_count, up to 5 sample words) for one engine.
+
+    Results are shared through ``scores`` between engines declaring the same
+    required_flags (e.g. every Korean-meaning engine), so each distinct
+    feature set costs one pass over the words.
+    """
+    flags = engine.required_flags
+    if flags and flags in scores:
+        return scores[flags]
+    if flags == ("example",):
+        mask = sentence_eligibility(words)
+    else:
+        can_generate = engine.can_generate
+        mask = [can_generate(w) for w in words]
+    # Count from the mask directly; only the sample materializes words
+    result = (sum(mask), [w.english for w in islice(compress(words, mask), 5)])
+    if flags:
+        scores[flags] = result
+    return result
 
 
 def generate_report(words: list[Word]) -> FullReport:
     """Generate a complete report analyzing all engines against the given word pool."""
-    pool = build_pool(words)
     total = len(words)
+    ENGINES["sentence"].warm(words)
 
     engine_reports: list[EngineReport] = []
+    scores: dict[tuple[str, ...], tuple[int, list[str]]] = {}
 
     for canonical_name, engine in ENGINES.items():
-        meta = _ENGINE_META.get(canonical_name, {})
-        eligible = [w for w in words if engine.can_generate(w)]
-        eligible_count = len(eligible)
+        eligible_count, sample = _score_engine(engine, words, scores)
         coverage = (eligible_count / total * 100) if total > 0 else 0.0
 
-        # Sample up to 5 eligible words
-        sample = [w.english for w in eligible[:5]]
-
+        korean_name, description, level_name, mastery_name, card, direction, is_typing = (
+            _ENGINE_ROW[canonical_name]
+        )
         engine_reports.append(EngineReport(
             canonical_name=canonical_name,
-            korean_name=meta.get("korean_name", ""),
-            description=meta.get("description", ""),
-            level_test_name=CANONICAL_TO_LEVEL.get(canonical_name, "N/A"),
-            mastery_name=CANONICAL_TO_MASTERY.get(canonical_name, "N/A"),
-            card_component=meta.get("card", ""),
-            answer_direction=meta.get("direction", ""),
-            is_typing=canonical_name in ("listen_type", "ko_type", "antonym_type"),
+            korean_name=korean_name,
+            description=description,
+            level_test_name=level_name,
+            mastery_name=mastery_name,
+            card_component=card,
+            answer_direction=direction,
+            is_typing=is_typing,
             eligible_count=eligible_count,
             total_words=total,
             coverage_pct=round(coverage, 1),
-            sample_words=sample,
+            sample_words=list(sample),
         ))
 
     words_with_example = sum(1 for w in words if w.example_en)
     pool_health = PoolHealthReport(
         total_words=total,
-        unique_korean=len(pool.all_korean),
-        unique_english=len(pool.all_english),
+        unique_korean=len({w.korean for w in words if w.korean}),
+        unique_english=len({w.english for w in words}),
         words_with_example=words_with_example,
         example_coverage_pct=round(words_with_example / total * 100, 1) if total > 0 else 0.0,
     )
 
-    from app.services.question_engines import LEGACY_NAME_MAP
-
     return FullReport(
         engine_reports=engine_reports,
         pool_health=pool_health,
         consumer_usages=_CONSUMER_USAGES,
-        legacy_mapping=dict(LEGACY_NAME_MAP),
+        legacy_mapping=_LEGACY_MAPPING_VIEW,
     )
 
 
+_RULE = "-" * 70
+_BANNER = "=" * 70
+_ENGINE_HEADER = (
+    f"  {'Engine':<14} {'Name':<8} {'Cover':>7} {'Eligible':>9} "
+    f"{'Typing':>7}  {'Direction'}"
+)
+_ENGINE_ROW_TMPL = "  {0:<14} {1:<8} {2:>6.1f}% {3:>8}/{4}  {5:>5}  {6}"
+
+
 def format_report_text(report: FullReport) -> str:
     """Format the FullReport as a human-readable text string."""
-    lines: list[str] = []
-    lines.append("=" * 70)
-    lines.append("  QUESTION ENGINE SYSTEM REPORT")
-    lines.append("=" * 70)
-
-    # Pool Health
     ph = report.pool_health
-    lines.append("")
-    lines.append(f"  Pool: {ph.total_words} words | "
-                 f"{ph.unique_korean} unique KO | "
-                 f"{ph.unique_english} unique EN | "
-                 f"{ph.words_with_example} with example ({ph.example_coverage_pct}%)")
-    lines.append("")
-
-    # Engine Reports
-    lines.append("-" * 70)
-    lines.append(f"  {'Engine':<14} {'Name':<8} {'Cover':>7} {'Eligible':>9} "
-                 f"{'Typing':>7}  {'Direction'}")
-    lines.append("-" * 70)
-
-    for er in report.engine_reports:
-        typing_mark = "YES" if er.is_typing else ""
-        lines.append(
-            f"  {er.canonical_name:<14} {er.korean_name:<8} {er.coverage_pct:>6.1f}% "
-            f"{er.eligible_count:>8}/{er.total_words}  "
-            f"{typing_mark:>5}  {er.answer_direction}"
-        )
+    row = _ENGINE_ROW_TMPL.format
+    lines: list[str] = [
+        _BANNER,
+        "  QUESTION ENGINE SYSTEM REPORT",
+        _BANNER,
+        # Pool Health
+        "",
+        f"  Pool: {ph.total_words} words | "
+        f"{ph.unique_korean} unique KO | "
+        f"{ph.unique_english} unique EN | "
+        f"{ph.words_with_example} with example ({ph.example_coverage_pct}%)",
+        "",
+        # Engine Reports
+        _RULE,
+        _ENGINE_HEADER,
+        _RULE,
+    ]
+    lines.extend(
+        row(er.canonical_name, er.korean_name, er.coverage_pct, er.eligible_count,
+            er.total_words, "YES" if er.is_typing else "", er.answer_direction)
+        for er in report.engine_reports
+    )
 
     # Legacy Mapping
-    lines.append("")
-    lines.append("-" * 70)
-    lines.append("  Legacy Name Mapping")
-    lines.append("-" * 70)
-    for legacy, canonical in sorted(report.legacy_mapping.items()):
-        lines.append(f"    {legacy:<22} -> {canonical}")
+    lines += ["", _RULE, "  Legacy Name Mapping", _RULE]
+    lines.extend(
+        f"    {legacy:<22} -> {canonical}"
+        for legacy, canonical in sorted(report.legacy_mapping.items())
+    )
 
     # Consumer Usage
-    lines.append("")
-    lines.append("-" * 70)
-    lines.append("  Consumer Usage Matrix")
-    lines.append("-" * 70)
+    lines += ["", _RULE, "  Consumer Usage Matrix", _RULE]
     for cu in report.consumer_usages:
-        engines_str = ", ".join(cu.engines_used)
         lines.append(f"    {cu.consumer}")
-        lines.append(f"      -> [{engines_str}]")
+        lines.append(f"      -> [{', '.join(cu.engines_used)}]")
 
-    lines.append("")
-    lines.append("=" * 70)
+    lines += ["", _BANNER]
     return "\n".join(lines)
@@ -8,8 +8,10 @@ Also provides apply_sentence_overlay() for converting any QuestionSpec
 into sentence mode (used by mastery engine).
 """
 import re
+from functools import lru_cache
+
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool, make_typing_hint
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine, make_typing_hint
 from app.services.question_engines.distractors import pick_english_distractors, shuffle_choices
 
 # ── Irregular verb table ──────────────────────────────────────────────────
@@ -76,42 +78,57 @@ _IRREGULAR: dict[str, set[str]] = {
 
 _POSSESSIVE_PAT = r"(?:my|your|his|her|its|our|their|one's)"
 _REFLEXIVE_PAT = r"(?:myself|yourself|himself|herself|itself|ourselves|yourselves|themselves)"
-_SUFFIX_PAT = r"(?:s|es|ed|ing|d|er|est|ly|tion|ment|ness|ful|less|ous|ive|al|able|ible)"
-_STOP_TOKENS = {"one's", "oneself", "a", "an", "the", "~", "..."}
+_SUFFIX_TABLE = (
+    "s", "es", "ed", "ing", "d", "er", "est", "ly", "tion",
+    "ment", "ness", "ful", "less", "ous", "ive", "al", "able", "ible",
+)
+_SUFFIX_PAT = r"(?:" + "|".join(_SUFFIX_TABLE) + r")"
+_SUFFIX_SET = frozenset(_SUFFIX_TABLE)
+# Characters whose str.lower() disagrees with re.IGNORECASE matching of an
+# ASCII letter (İ, dotless ı, long ſ); sentences containing them take the
+# regex path.
+_CASE_UNSAFE = ("\u0130", "\u0131", "\u017f")
+_SPECIAL_TOKEN_RE = {"one's": _POSSESSIVE_PAT, "oneself": _REFLEXIVE_PAT}
+_STOP_TOKENS = frozenset({"one's", "oneself", "a", "an", "the", "~", "..."})
+# Escaped alternation of each irregular verb's forms, built once at import.
+_IRREGULAR_RE: dict[str, str] = {
+    base: "|".join(re.escape(f) for f in sorted(forms))
+    for base, forms in _IRREGULAR.items()
+}
+_STEM_SUFFIX_PAT = r"(?:ing|ed|er|est)"
 
 
+@lru_cache(maxsize=8192)
 def _build_word_re(word: str) -> str:
     """Build regex alternation for a word including irregular forms and suffixes."""
     base = word.lower()
     forms = {re.escape(base)}
-    if base in _IRREGULAR:
-        for f in _IRREGULAR[base]:
-            forms.add(re.escape(f))
+    irregular = _IRREGULAR_RE.get(base)
+    if irregular:
+        forms.add(irregular)
     escaped = re.escape(base)
     forms.add(escaped + _SUFFIX_PAT)
     # Handle silent-e doubling: e.g. "make" -> "making" (strip e + ing)
     if base.endswith("e") and len(base) > 2:
         stem = re.escape(base[:-1])
-        forms.add(stem + r"(?:ing|ed|er|est)")
+        forms.add(stem + _STEM_SUFFIX_PAT)
     # Handle consonant doubling: e.g. "run" -> "running"
     if len(base) >= 2 and base[-1] not in "aeiouywx" and base[-2] in "aeiou":
         doubled = re.escape(base + base[-1])
-        forms.add(doubled + r"(?:ing|ed|er|est)")
+        forms.add(doubled + _STEM_SUFFIX_PAT)
     return r"(?:" + "|".join(forms) + r")"
 
 
+@lru_cache(maxsize=8192)
 def _token_re(token: str) -> str | None:
     """Convert a phrase token into a regex pattern, or None to skip."""
     low = token.lower().strip()
     if low in _STOP_TOKENS or not low:
         return None
-    if low == "one's":
-        return _POSSESSIVE_PAT
-    if low == "oneself":
-        return _REFLEXIVE_PAT
-    return _build_word_re(low)
+    return _SPECIAL_TOKEN_RE.get(low) or _build_word_re(low)
 
 
+@lru_cache(maxsize=8192)
 def _clean_phrase(phrase: str) -> str:
     """Remove annotations from a phrase: ~, ..., (), "", -ing suffix."""
     cleaned = phrase
@@ -123,22 +140,98 @@ def _clean_phrase(phrase: str) -> str:
     return cleaned
 
 
+@lru_cache(maxsize=8192)
+def _compile_exact(word: str) -> re.Pattern:
+    """Compile the combined Phase 1 pattern for a target word.
+
+    One alternation covers both the exact and the inflected form; the
+    ``sfx`` group is unset when the exact form matched. The exact branch is
+    tried first at each position so a bare occurrence is never reported as
+    inflected.
+    """
+    escaped = re.escape(word)
+    return re.compile(
+        r'\b' + escaped + r'(?:\b|(?P<sfx>' + _SUFFIX_PAT + r')\b)',
+        re.IGNORECASE,
+    )
+
+
+@lru_cache(maxsize=8192)
+def _compile_ci(pattern: str) -> re.Pattern:
+    """Case-insensitive compile, cached past the re module's small internal cache."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _is_word_char(c: str) -> bool:
+    """Same test as the regex ``\\w`` class for str patterns."""
+    return c.isalnum() or c == '_'
+
+
+def _find_word_span(sentence: str, word: str) -> tuple[int, int] | None:
+    """Phase 1 match for an ASCII alphabetic word without regex.
+
+    Locates case-insensitive occurrences with str.find, checks the word
+    boundaries by hand and accepts the rest of the word run only when it is
+    empty (exact) or a known suffix (inflected). Returns the span of the
+    first exact occurrence, else of the first inflected one.
+    """
+    low = sentence.lower()
+    target = word.lower()
+    n, size = len(sentence), len(target)
+    inflected = None
+    pos = low.find(target)
+    while pos != -1:
+        if pos == 0 or not _is_word_char(sentence[pos - 1]):
+            end = tail = pos + size
+            while tail < n and _is_word_char(sentence[tail]):
+                tail += 1
+            if tail == end:
+                return pos, end
+            if inflected is None and low[end:tail] in _SUFFIX_SET:
+                inflected = (pos, tail)
+        pos = low.find(target, pos + 1)
+    return inflected
+
+
 def _try_exact(sentence: str, word: str) -> str | None:
-    """Try exact + inflected match (Phase 1 logic)."""
+    """Try exact + inflected match (Phase 1 logic).
+
+    The first exact occurrence wins; otherwise the first inflected one.
+    """
     if not word:
         return None
-    # Exact
-    pat = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-    if pat.search(sentence):
-        return pat.sub('____', sentence, count=1)
-    # Inflected
-    ipat = re.compile(
-        r'\b' + re.escape(word) + r'(?:' + _SUFFIX_PAT + r')?\b',
-        re.IGNORECASE,
-    )
-    if ipat.search(sentence):
-        return ipat.sub('____', sentence, count=1)
-    return None
+    if word.isascii() and word.isalpha() and (
+        sentence.isascii() or not any(c in sentence for c in _CASE_UNSAFE)
+    ):
+        span = _find_word_span(sentence, word)
+        if span is None:
+            return None
+        return sentence[:span[0]] + '____' + sentence[span[1]:]
+    match = None
+    for m in _compile_exact(word).finditer(sentence):
+        if m.group('sfx') is None:
+            match = m
+            break
+        if match is None:
+            match = m
+    if match is None:
+        return None
+    return sentence[:match.start()] + '____' + sentence[match.end():]
+
+
+@lru_cache(maxsize=8192)
+def _phrase_patterns(phrase: str, blank_all: bool) -> tuple[re.Pattern | None, tuple[re.Pattern, ...]]:
+    """Compile the Phase 3 patterns for a phrase once.
+
+    Returns the whole-phrase pattern (only for blank_all with 2+ content
+    tokens) and one single-word pattern per content token, in order.
+    """
+    word_res = [p for p in map(_token_re, phrase.split()) if p]
+    full_pat = None
+    if blank_all and len(word_res) >= 2:
+        full_pat = _compile_ci(r'\s+'.join(r'\b' + p + r'\b' for p in word_res))
+    singles = tuple(_compile_ci(r'\b' + p + r'\b') for p in word_res)
+    return full_pat, singles
 
 
 def _try_phrase_match(sentence: str, phrase: str, blank_all: bool = True) -> str | None:
@@ -147,48 +240,23 @@ def _try_phrase_match(sentence: str, phrase: str, blank_all: bool = True) -> str
     When blank_all=True (standalone phrasal verbs like "give off"),
     blanks all consecutive content tokens as one ____.
     When blank_all=False (phrases with ~ like "go to ~"),
-    blanks only the first content word for context.
+    blanks only the first content word that occurs in the sentence.
     """
-    tokens = phrase.split()
-    content_tokens = []
-    for t in tokens:
-        low = t.lower().strip()
-        if low in _STOP_TOKENS or not low:
-            continue
-        content_tokens.append(t)
-
-    if not content_tokens:
-        return None
+    full_pat, singles = _phrase_patterns(phrase, blank_all)
 
     # Blank all consecutive content tokens as a single unit
-    if blank_all and len(content_tokens) >= 2:
-        parts = []
-        for t in content_tokens:
-            p = _build_word_re(t.lower().strip())
-            parts.append(r'\b' + p + r'\b')
-        full_pat = re.compile(r'\s+'.join(parts), re.IGNORECASE)
+    if full_pat is not None:
         m = full_pat.search(sentence)
         if m:
             return sentence[:m.start()] + '____' + sentence[m.end():]
 
-    # Blank only first content word (with context for disambiguation)
-    for i, token in enumerate(content_tokens):
-        word_pat = _build_word_re(token.lower().strip())
-        if i + 1 < len(content_tokens):
-            next_tok = content_tokens[i + 1].lower().strip()
-            next_re = _token_re(next_tok)
-            if next_re:
-                ctx_pat = re.compile(
-                    r'\b' + word_pat + r'\b\s+' + r'\b' + next_re + r'\b',
-                    re.IGNORECASE,
-                )
-                if ctx_pat.search(sentence):
-                    single = re.compile(r'\b' + word_pat + r'\b', re.IGNORECASE)
-                    return single.sub('____', sentence, count=1)
-
-        single = re.compile(r'\b' + word_pat + r'\b', re.IGNORECASE)
-        if single.search(sentence):
-            return single.sub('____', sentence, count=1)
+    # Blank only the first matching content word. A "word + next token"
+    # context hit always implies the word alone matches at the same place,
+    # so the single-word search alone decides.
+    for single in singles:
+        m = single.search(sentence)
+        if m:
+            return sentence[:m.start()] + '____' + sentence[m.end():]
 
     return None
 
@@ -197,7 +265,7 @@ def _try_abbreviation(sentence: str, target_word: str) -> str | None:
     """Match abbreviations like a.m., p.m., P.E. without word boundaries."""
     if '.' not in target_word:
         return None
-    pat = re.compile(re.escape(target_word), re.IGNORECASE)
+    pat = _compile_ci(re.escape(target_word))
     m = pat.search(sentence)
     if not m:
         return None
@@ -210,6 +278,30 @@ def _try_abbreviation(sentence: str, target_word: str) -> str | None:
     return result
 
 
+# Non-ASCII characters re.IGNORECASE matches to ASCII letters:
+# İ and ı (i), ſ (s) and the Kelvin sign (k).
+_IGNORECASE_ASCII_ALIASES = frozenset("\u0130\u0131\u017f\u212a")
+
+
+@lru_cache(maxsize=8192)
+def _substring_anchor(target_word: str) -> str | None:
+    """Substring every blankable occurrence of a plain word must contain.
+
+    Only defined for ASCII single words without irregular forms: every
+    pattern built for them starts with the word, or with its stem minus a
+    silent e. Returns None when no safe anchor exists.
+    """
+    if not (target_word.isascii() and target_word.isalpha()):
+        return None
+    base = target_word.lower()
+    if base in _IRREGULAR:
+        return None
+    if base.endswith("e") and len(base) > 2:
+        return base[:-1]
+    return base
+
+
+@lru_cache(maxsize=8192)
 def make_sentence_blank(sentence: str, target_word: str) -> str | None:
     """Replace the target word in the sentence with ____.
 
@@ -224,7 +316,20 @@ def make_sentence_blank(sentence: str, target_word: str) -> str | None:
         return None
 
     # Strip <word> markers that some DB examples contain
-    sentence = re.sub(r'<([^>]+)>', r'\1', sentence)
+    if '<' in sentence:
+        sentence = re.sub(r'<([^>]+)>', r'\1', sentence)
+
+    # Cheap reject before any regex: most (sentence, word) pairs don't share
+    # the word at all. Only valid when IGNORECASE can match the ASCII anchor
+    # solely against ASCII letters, so sentences holding one of its non-ASCII
+    # aliases skip the shortcut.
+    anchor = _substring_anchor(target_word)
+    if (
+        anchor is not None
+        and _IGNORECASE_ASCII_ALIASES.isdisjoint(sentence)
+        and anchor not in sentence.lower()
+    ):
+        return None
 
     # Phase 1: exact + inflected
     result = _try_exact(sentence, target_word)
@@ -254,50 +359,146 @@ def make_sentence_blank(sentence: str, target_word: str) -> str | None:
     return None
 
 
-def _pick_example(word: Word) -> tuple[str, str] | None:
+def _pick_example(word: Word) -> tuple[str, str, str] | None:
     """Pick an example sentence from word.examples or fall back to word.example_en/ko.
 
-    Returns (example_en, example_ko) tuple or None if no usable example.
+    Returns (example_en, example_ko, sentence_blank) tuple or None if no
+    usable example. The blank is the one computed while checking usability,
+    so callers don't run make_sentence_blank a second time.
     """
     # Try word.examples first (1:N relationship)
     examples = getattr(word, 'examples', None)
     if examples:
-        # Filter to examples where the word appears in the sentence
-        usable = [
-            ex for ex in examples
-            if make_sentence_blank(ex.example_en, word.english) is not None
-        ]
-        if usable:
-            # Pick the shortest (easiest) sentence
-            chosen = min(usable, key=lambda ex: len(ex.example_en))
-            return (chosen.example_en, chosen.example_ko)
+        # Pick the shortest (easiest) sentence the word appears in: test in
+        # length order and stop at the first hit. sorted() is stable, so
+        # ties resolve to the earlier example as min() would.
+        for ex in sorted(examples, key=lambda ex: len(ex.example_en or "")):
+            blank = make_sentence_blank(ex.example_en, word.english)
+            if blank is not None:
+                return (ex.example_en, ex.example_ko, blank)
 
     # Fallback to legacy columns
-    if word.example_en and make_sentence_blank(word.example_en, word.english) is not None:
-        return (word.example_en, word.example_ko or "")
+    if word.example_en:
+        blank = make_sentence_blank(word.example_en, word.english)
+        if blank is not None:
+            return (word.example_en, word.example_ko or "", blank)
 
     return None
 
 
-class SentenceEngine:
+def _example_fields(
+    word: Word, example: tuple[str, str, str] | None,
+) -> tuple[str | None, str, str | None]:
+    """Unpack a picked example, falling back to the word's legacy columns.
+
+    Shared by the sentence and sentence_type engines for generate() calls
+    made without a usable example.
+    """
+    if example:
+        return example
+    return word.example_en, word.example_ko or "", make_sentence_blank(word.example_en, word.english)
+
+
+def _is_plain_target(target: str) -> bool:
+    """True for single ASCII words whose phases collapse to one forms search."""
+    return target.isascii() and target.isalpha() and target.lower() not in _STOP_TOKENS
+
+
+def _forms_pattern(target: str) -> re.Pattern:
+    """``\\b<word forms>\\b`` pattern used by the bulk eligibility scan."""
+    return _compile_ci(r'\b' + _build_word_re(target.lower()) + r'\b')
+
+
+def _warm_target(target: str) -> None:
+    """Populate the pattern caches make_sentence_blank consults for a target."""
+    _compile_exact(target)
+    if _is_plain_target(target):
+        _substring_anchor(target)
+        _forms_pattern(target)
+        return
+    cleaned = _clean_phrase(target)
+    if cleaned != target:
+        _compile_exact(cleaned)
+    _phrase_patterns(cleaned, '~' not in target)
+    if '.' in target:
+        _compile_ci(re.escape(target))
+
+
+def sentence_eligibility(words: list[Word]) -> list[bool]:
+    """Bulk equivalent of ``_pick_example(w) is not None`` for reporting.
+
+    For a plain single-word target (ASCII letters, not a stop token) every
+    blanking phase reduces to one ``\\b<word forms>\\b`` search, so all of the
+    word's example sentences are scanned in a single pass. Phrases,
+    abbreviations and other annotated targets use the per-example pipeline.
+    """
+    result: list[bool] = []
+    for w in words:
+        target = w.english
+        if not target:
+            result.append(False)
+            continue
+        if not _is_plain_target(target):
+            result.append(_pick_example(w) is not None)
+            continue
+        sentences = [ex.example_en for ex in (getattr(w, 'examples', None) or ()) if ex.example_en]
+        if w.example_en:
+            sentences.append(w.example_en)
+        if not sentences:
+            result.append(False)
+            continue
+        text = "\n".join(re.sub(r'<([^>]+)>', r'\1', s) for s in sentences)
+        result.append(_forms_pattern(target).search(text) is not None)
+    return result
+
+
+class SentenceEngine(QuestionEngine):
     question_type = "sentence"
+    required_flags = ("example",)
 
     def can_generate(self, word: Word) -> bool:
         return _pick_example(word) is not None
 
+    def warm(self, words: list[Word]) -> None:
+        """Precompile blanking patterns for every target word up front.
+
+        The patterns live in module-level caches shared with sentence_type,
+        so later can_generate/generate calls and the report's bulk scan only
+        search.
+        """
+        for target in {w.english for w in words if w.english}:
+            _warm_target(target)
+
     def generate(
         self,
         word: Word,
         pool: DistractorPool,
         n_choices: int = 4,
+    ) -> QuestionSpec:
+        return self._build(word, pool, _pick_example(word), n_choices)
+
+    def try_generate(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        n_choices: int = 4,
+    ) -> QuestionSpec | None:
+        example = _pick_example(word)
+        if example is None:
+            return None
+        return self._build(word, pool, example, n_choices)
+
+    def _build(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        example: tuple[str, str, str] | None,
+        n_choices: int,
     ) -> QuestionSpec:
         correct = word.english
         distractors = pick_english_distractors(correct, pool, n_choices - 1, source_word=word)
 
-        example = _pick_example(word)
-        ex_en = example[0] if example else word.example_en
-        ex_ko = example[1] if example else (word.example_ko or "")
-        blank = make_sentence_blank(ex_en, word.english)
+        ex_en, ex_ko, blank = _example_fields(word, example)
 
         return QuestionSpec(
             question_type=self.question_type,
@@ -323,8 +524,7 @@ def apply_sentence_overlay(spec: QuestionSpec) -> QuestionSpec | None:
     if not example:
         return None
 
-    ex_en, ex_ko = example
-    blank = make_sentence_blank(ex_en, word.english)
+    ex_en, ex_ko, blank = example
     if not blank:
         return None
 
@@ -8,12 +8,13 @@ Combines sentence blank context with typing input.
 Shows first letter + underscores as hint.
 """
 from app.models.word import Word
-from app.services.question_engines.base import QuestionSpec, DistractorPool, make_typing_hint, clean_english_for_typing
-from app.services.question_engines.sentence import _pick_example, make_sentence_blank
+from app.services.question_engines.base import QuestionSpec, DistractorPool, QuestionEngine, _hint_from_clean, clean_english_for_typing
+from app.services.question_engines.sentence import _example_fields, _pick_example
 
 
-class SentenceTypeEngine:
+class SentenceTypeEngine(QuestionEngine):
     question_type = "sentence_type"
+    required_flags = ("example",)
 
     def can_generate(self, word: Word) -> bool:
         return _pick_example(word) is not None
@@ -24,14 +25,27 @@ class SentenceTypeEngine:
         pool: DistractorPool,
         n_choices: int = 4,
     ) -> QuestionSpec:
-        correct = clean_english_for_typing(word.english)
+        return self._build(word, _pick_example(word))
 
+    def try_generate(
+        self,
+        word: Word,
+        pool: DistractorPool,
+        n_choices: int = 4,
+    ) -> QuestionSpec | None:
         example = _pick_example(word)
-        ex_en = example[0] if example else word.example_en
-        ex_ko = example[1] if example else (word.example_ko or "")
-        blank = make_sentence_blank(ex_en, word.english)
+        if example is None:
+            return None
+        return self._build(word, example)
+
+    def _build(self, word: Word, example: tuple[str, str, str] | None) -> QuestionSpec:
+        english = word.english
+        correct = clean_english_for_typing(english)
+
+        ex_en, ex_ko, blank = _example_fields(word, example)
 
-        hint = make_typing_hint(word.english)
+        # Same as make_typing_hint(english), reusing the cleaned answer
+        hint = _hint_from_clean(correct) if english else None
 
         return QuestionSpec(
             question_type=self.question_type,
@@ -10,10 +10,21 @@ Provides:
 - Time breakdown by engine category
 - Consolidated report assembly (assemble_report_metrics)
 """
+import asyncio
+import functools
+import json
+import random
+import time
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, Integer
 
+from app.db.session import sibling_session
 from app.models.user import User
 from app.models.word import Word
 from app.models.test_session import TestSession
@@ -72,7 +83,7 @@ def get_vocab_description(rank: int, accuracy_pct: int) -> str:
 
     Example: "초등필수 단어 40% 이해"
     """
-    label = _RANK_VOCAB_LABEL.get(rank, "어휘")
+    label = _rank_row(rank)[1]
     return f"{label} {accuracy_pct}% 이해"
 
 RANK_TO_BOOK: dict[int, str] = {
@@ -93,6 +104,20 @@ RANK_TO_BOOK: dict[int, str] = {
     15: "POWER VOCA 수능 기출 5000-05",
 }
 
+# (grade, vocab label, book) per POWER VOCA rank, indexed by rank so a
+# report resolves all three with one bounds check and one tuple index.
+_RANK_ROW_FALLBACK = ("미정", "어휘", "")
+_RANK_ROWS: tuple[tuple[str, str, str], ...] = (_RANK_ROW_FALLBACK,) + tuple(
+    (RANK_TO_GRADE[r], _RANK_VOCAB_LABEL[r], RANK_TO_BOOK[r])
+    for r in range(1, len(RANK_TO_GRADE) + 1)
+)
+
+
+def _rank_row(rank: int) -> tuple[str, str, str]:
+    """(grade, vocab label, book) for a rank, or the fallback row if unknown."""
+    return _RANK_ROWS[rank] if 0 < rank < len(_RANK_ROWS) else _RANK_ROW_FALLBACK
+
+
 # ── 능률 VOCA series mappings ─────────────────────────────────────────────
 
 NEUNGYUL_RANK_TO_BOOK: dict[int, str] = {
@@ -128,13 +153,13 @@ def get_neungyul_rank(level: int, accuracy_pct: int) -> int:
 # ── Skill area (능력영역) system ───────────────────────────────────────────
 # 6 testable areas: 5 core + comprehensive (sentence_type engine)
 
-SKILL_AREA_ENGINES: dict[str, list[str]] = {
-    "meaning":        ["en_to_ko", "antonym_choice"],
-    "association":    ["ko_to_en", "emoji"],
-    "listening":      ["listen_en", "listen_ko"],
-    "inference":      ["sentence"],
-    "spelling":       ["listen_type", "ko_type", "antonym_type"],
-    "comprehensive":  ["sentence_type"],
+SKILL_AREA_ENGINES: dict[str, tuple[str, ...]] = {
+    "meaning":        ("en_to_ko", "antonym_choice"),
+    "association":    ("ko_to_en", "emoji"),
+    "listening":      ("listen_en", "listen_ko"),
+    "inference":      ("sentence",),
+    "spelling":       ("listen_type", "ko_type", "antonym_type"),
+    "comprehensive":  ("sentence_type",),
 }
 
 ENGINE_TO_SKILL: dict[str, str] = {
@@ -152,84 +177,24 @@ SKILL_AREA_NAMES: dict[str, str] = {
     "comprehensive": "종합응용력",
 }
 
-SKILL_AREA_KEYS = ["meaning", "association", "listening", "inference", "spelling", "comprehensive"]
-
-# Per-skill-area interpretive descriptions by 10% score tier (1~10)
-# Tier 1 = 0~10%, Tier 2 = 11~20%, ... Tier 10 = 91~100%
-_SKILL_DESC: dict[str, dict[int, str]] = {
-    "meaning": {
-        1: "영어 단어의 뜻을 거의 파악하지 못하는 단계입니다. 가장 기초적인 생활 영단어(예: apple, book, happy)부터 그림 카드와 함께 매일 5개씩 반복 학습하는 것을 권장합니다.",
-        2: "기초 단어의 뜻을 일부 알고 있으나 대부분 혼동합니다. 자주 접하는 일상 단어를 플래시카드로 만들어 하루 10개씩 반복하면 빠르게 기초를 다질 수 있습니다.",
-        3: "기본 단어의 뜻을 어렴풋이 알지만 정확도가 낮습니다. 단어장을 활용해 뜻과 예문을 함께 외우는 습관을 들이면 의미 파악력이 크게 향상됩니다.",
-        4: "일상적인 단어의 뜻은 대체로 파악하지만 비슷한 뜻의 단어를 혼동하는 경우가 많습니다. 유의어를 그룹으로 묶어 차이를 비교하며 학습하세요.",
-        5: "중간 수준의 의미 파악력을 보입니다. 기본 어휘는 안정적이나 다의어나 추상적 단어에서 오답이 발생합니다. 예문 속에서 단어의 쓰임을 파악하는 연습이 필요합니다.",
-        6: "평균 이상의 의미 파악력입니다. 대부분의 단어 뜻을 맞히지만 고난도 어휘에서 간혹 실수합니다. 수능 빈출 어휘와 다의어의 두 번째, 세 번째 뜻까지 학습해 보세요.",
-        7: "우수한 의미 파악력을 보여줍니다. 다의어의 문맥별 뜻 차이를 대부분 구분합니다. 학술 용어와 고급 어휘로 영역을 확장하면 상위권에 진입할 수 있습니다.",
-        8: "뛰어난 의미 파악력입니다. 고난도 어휘와 유사어의 미묘한 차이까지 정확히 구분합니다. 영영 사전으로 뉘앙스를 더 깊이 이해하면 최상위 수준에 도달합니다.",
-        9: "최상위 수준의 의미 파악력입니다. 대부분의 어휘를 정확하고 빠르게 파악하며, 학술 및 전문 용어까지 폭넓게 이해합니다. 원서 읽기로 실전 감각을 유지하세요.",
-        10: "완벽에 가까운 의미 파악력입니다. 모든 수준의 어휘를 즉시 파악하며 다의어, 유사어, 학술 용어까지 완벽합니다. 현재 수준을 유지하며 독해 속도 향상에 집중하세요.",
-    },
-    "association": {
-        1: "한국어 뜻에서 영어 단어를 거의 떠올리지 못하는 단계입니다. 그림-단어 매칭 게임이나 이미지 연상 카드를 활용해 시각적으로 연결하는 연습부터 시작하세요.",
-        2: "아주 기본적인 단어만 연상할 수 있습니다. 매일 사용하는 물건에 영어 이름표를 붙여두고, 보는 즉시 영어 단어를 말하는 습관을 들여 보세요.",
-        3: "기초 단어의 연상은 가능하나 속도가 느리고 정확도가 낮습니다. 한국어 뜻을 보고 3초 안에 영어 단어를 말하는 속도 훈련이 효과적입니다.",
-        4: "일상 어휘는 연상하지만 비슷한 뜻의 단어끼리 혼동합니다. 유의어(big/large/huge)를 그룹으로 묶어 상황별 쓰임을 구분하는 연습이 도움됩니다.",
-        5: "중간 수준의 연상력입니다. 기본 어휘는 빠르게 떠올리지만 추상적 개념이나 고급 어휘에서 막힙니다. 주제별(감정, 과학, 사회) 어휘를 정리하며 연상 범위를 넓히세요.",
-        6: "평균 이상의 연상력을 보입니다. 대부분의 단어를 연상하지만 동의어 중 최적의 단어 선택에 어려움이 있습니다. 콜로케이션(자주 함께 쓰는 단어 조합)을 학습하세요.",
-        7: "우수한 연상력입니다. 유의어 간 미묘한 차이를 인식하고 상황에 맞는 단어를 선택합니다. 반의어와 파생어까지 함께 정리하면 어휘 네트워크가 더 강화됩니다.",
-        8: "뛰어난 연상력을 보여줍니다. 한국어 뜻에서 영어 단어를 즉시 떠올리며 유의어/반의어 관계까지 정확합니다. 영어로 생각하는 습관을 기르면 최고 수준에 도달합니다.",
-        9: "최상위 수준의 연상력입니다. 복잡한 개념도 적절한 영어 단어로 즉시 표현하며, 어휘 간 관계를 체계적으로 파악합니다. 영작문을 통해 실전 활용력을 높이세요.",
-        10: "완벽한 연상력입니다. 모든 개념을 즉시 영어로 변환하며 뉘앙스에 맞는 최적의 단어를 선택합니다. 현재 수준을 유지하며 표현의 다양성을 더해 보세요.",
-    },
-    "listening": {
-        1: "영어 발음을 듣고 단어를 거의 인식하지 못합니다. 알파벳 음가(phonics)부터 시작해서 기초 단어의 발음을 하나씩 익히세요. 매일 10분씩 영어 발음 듣기 연습을 권장합니다.",
-        2: "아주 기본적인 단어 발음만 인식합니다. 영어 단어를 들으며 따라 말하는 섀도잉(shadowing) 연습을 매일 하면 듣기 능력이 빠르게 향상됩니다.",
-        3: "기초 단어는 들리지만 비슷한 발음의 단어를 구분하지 못합니다. 최소 대립쌍(예: bat/bet, ship/sheep) 듣기 훈련으로 발음 차이를 인식하는 연습이 필요합니다.",
-        4: "일상 단어의 발음을 대체로 인식하지만 강세나 모음 차이에서 혼동합니다. 단어의 강세 위치를 의식하며 듣는 연습을 하고, 발음 기호를 함께 학습하세요.",
-        5: "중간 수준의 청취력입니다. 명확한 발음은 잘 인식하지만 빠른 속도나 연음에서 어려움이 있습니다. 영어 동영상을 자막 없이 시청하며 자연스러운 발음에 익숙해지세요.",
-        6: "평균 이상의 청취력을 보입니다. 대부분의 단어 발음을 정확히 인식하며, 비슷한 발음도 문맥 속에서 구분합니다. 다양한 억양(미국/영국식)에 노출되면 더 향상됩니다.",
-        7: "우수한 청취력입니다. 빠른 속도와 다양한 억양에서도 단어를 정확히 인식합니다. 팟캐스트나 뉴스 청취로 고급 어휘의 발음까지 익히면 최상위권에 진입합니다.",
-        8: "뛰어난 청취력을 보여줍니다. 연음, 축약, 다양한 억양 상황에서도 정확하게 단어를 식별합니다. 학술 강연이나 TED 토크 청취로 실전 감각을 유지하세요.",
-        9: "최상위 수준의 청취력입니다. 거의 모든 상황에서 영어 발음을 즉시 인식하고 정확한 의미를 파악합니다. 원어민 대화 수준의 자연스러운 영어를 청취하세요.",
-        10: "완벽에 가까운 청취력입니다. 모든 속도, 억양, 상황에서 영어 단어를 즉시 정확하게 인식합니다. 현재 수준을 유지하며 리스닝 실력을 독해와 연결해 보세요.",
-    },
-    "inference": {
-        1: "문맥에서 단어를 추론하는 것이 매우 어려운 단계입니다. 짧고 쉬운 영어 문장을 매일 읽으며 단어가 어떤 상황에서 쓰이는지 감각을 키우는 것이 우선입니다.",
-        2: "아주 기본적인 문장에서만 단어를 유추할 수 있습니다. 그림이 있는 쉬운 영어 동화책을 읽으며 모르는 단어를 문맥으로 유추하는 연습을 시작하세요.",
-        3: "단순한 문맥에서 단어를 추론할 수 있으나 정확도가 낮습니다. 빈칸 채우기 문제를 매일 풀며 문맥 단서를 찾는 습관을 기르면 크게 향상됩니다.",
-        4: "일상적 문맥에서는 추론이 가능하지만 복잡한 문장에서 오답이 많습니다. 예문을 많이 읽으면서 단어가 어떤 품사, 어떤 문맥에서 쓰이는지 패턴을 익히세요.",
-        5: "중간 수준의 추론력입니다. 기본 문맥 추론은 안정적이나 관용 표현이나 고급 어휘가 포함된 문장에서 어려움이 있습니다. 다양한 장르의 짧은 지문을 읽는 습관이 필요합니다.",
-        6: "평균 이상의 추론력을 보입니다. 대부분의 문맥에서 적절한 단어를 찾아내며, 기본 관용 표현도 이해합니다. 수능 유형의 빈칸 추론 문제를 연습하면 더 향상됩니다.",
-        7: "우수한 추론력입니다. 복잡한 문장 구조와 관용 표현에서도 정확하게 단어를 추론합니다. 영자 신문이나 잡지를 읽으며 고급 문맥 추론력을 키워 보세요.",
-        8: "뛰어난 추론력을 보여줍니다. 학술적 지문이나 복합 문장에서도 빈칸에 맞는 단어를 빠르고 정확하게 찾아냅니다. 원서 다독으로 추론 속도를 더 높여 보세요.",
-        9: "최상위 수준의 추론력입니다. 거의 모든 문맥에서 정확한 단어를 추론하며, 문장의 논리 흐름을 빠르게 파악합니다. 비문학 독해로 다양한 분야의 어휘를 확장하세요.",
-        10: "완벽에 가까운 추론력입니다. 모든 난이도의 문맥에서 즉시 적절한 단어를 파악하며 논리적 추론이 탁월합니다. 현재 실력을 유지하며 비판적 독해로 발전시키세요.",
-    },
-    "spelling": {
-        1: "영어 철자를 거의 기억하지 못하는 단계입니다. 알파벳과 기초 단어(3~4글자)의 철자를 소리 내어 읽으며 쓰는 연습부터 시작하세요. 하루 3개씩 정확히 외우는 것을 목표로 합니다.",
-        2: "아주 기본적인 짧은 단어만 쓸 수 있습니다. 자주 사용하는 단어를 매일 5개씩 발음하며 받아쓰기 하면 철자 감각이 빠르게 형성됩니다.",
-        3: "짧은 단어의 철자는 기억하나 모음이나 이중 자음에서 자주 틀립니다. 틀린 단어를 오답 노트에 정리하고 3일 간격으로 반복 테스트하는 것이 효과적입니다.",
-        4: "기본 단어의 철자를 대체로 기억하지만 비슷한 철자의 단어를 혼동합니다. 자주 혼동하는 단어 쌍(예: their/there, quiet/quite)을 모아 집중 연습하세요.",
-        5: "중간 수준의 철자 기억력입니다. 일상 단어는 정확하게 쓰지만 긴 단어나 불규칙 철자에서 실수합니다. 접두사/접미사 규칙(un-, -tion, -ment)을 학습하면 체계적으로 기억할 수 있습니다.",
-        6: "평균 이상의 철자 기억력을 보입니다. 대부분의 단어를 정확히 타이핑하며, 기본적인 형태소 규칙을 이해합니다. 고급 접사와 어근(etymology) 학습으로 더 향상시킬 수 있습니다.",
-        7: "우수한 철자 기억력입니다. 긴 단어와 복잡한 철자도 대부분 정확합니다. 라틴어/그리스어 어근을 학습하면 처음 보는 단어의 철자도 추론할 수 있게 됩니다.",
-        8: "뛰어난 철자 기억력을 보여줍니다. 불규칙 철자와 예외적인 단어까지 정확하게 기억합니다. 속도와 정확성을 동시에 높이는 타이핑 연습을 병행하세요.",
-        9: "최상위 수준의 철자 기억력입니다. 거의 모든 단어를 빠르고 정확하게 타이핑하며, 영어 형태론에 대한 깊은 이해를 보여줍니다. 학술 용어 철자까지 도전해 보세요.",
-        10: "완벽에 가까운 철자 기억력입니다. 모든 수준의 단어를 즉시 정확하게 타이핑합니다. 현재 수준을 유지하며 다양한 분야의 전문 용어로 어휘 범위를 넓혀 보세요.",
-    },
-    "comprehensive": {
-        1: "영어 어휘 전반에 걸쳐 기초부터 다져야 하는 단계입니다. 가장 기본적인 생활 영단어부터 차근차근 학습하면 모든 영역이 함께 성장합니다. 꾸준함이 가장 중요합니다.",
-        2: "전체적으로 기초 단계이며, 모든 영역에서 기본기 훈련이 필요합니다. 매일 꾸준히 15분씩 단어 학습을 이어가면 빠른 시일 내에 눈에 띄는 성장을 경험할 수 있습니다.",
-        3: "기초 어휘력은 형성되어 가고 있으나 전반적으로 보강이 필요합니다. 가장 약한 영역 1~2개를 우선 집중 학습하면 종합 점수가 효과적으로 올라갑니다.",
-        4: "기본적인 어휘 능력이 갖춰지고 있습니다. 일부 영역에서 성장이 보이며, 약한 영역을 보완하면 중급 수준에 빠르게 도달할 수 있습니다. 균형 잡힌 학습 계획을 세워 보세요.",
-        5: "중간 수준의 종합 어휘력입니다. 기본기는 안정적이며, 영역별 강약이 뚜렷합니다. 강한 영역을 유지하면서 약한 영역에 학습 시간을 더 배분하면 효과적입니다.",
-        6: "평균 이상의 종합 어휘력을 보여줍니다. 대부분의 영역에서 안정적인 실력을 갖추고 있으며, 상대적으로 약한 영역 1~2개만 집중하면 상위권에 진입합니다.",
-        7: "우수한 종합 어휘력입니다. 여러 영역에서 고른 실력을 보이며 고급 어휘 학습 단계에 접어들었습니다. 심화 학습과 실전 문제 풀이를 병행하면 더욱 성장합니다.",
-        8: "뛰어난 종합 어휘력을 보여줍니다. 모든 영역에서 높은 수준의 실력을 유지하고 있습니다. 원서 읽기, 영작문 등 실전 활용을 통해 어휘력을 더욱 견고히 하세요.",
-        9: "최상위 수준의 종합 어휘력입니다. 모든 영역에서 탁월한 실력을 보이며 고급 어휘까지 폭넓게 이해합니다. 다양한 분야의 영어 원서를 읽으며 실력을 유지하세요.",
-        10: "완벽에 가까운 종합 어휘력입니다. 모든 영역에서 최고 수준의 실력을 갖추고 있습니다. 현재의 뛰어난 실력을 유지하면서 영어 독서와 실전 활용으로 발전시키세요.",
-    },
-}
+SKILL_AREA_KEYS = ("meaning", "association", "listening", "inference", "spelling", "comprehensive")
+
+# Per-skill-area interpretive descriptions by 10% score tier (1~10), kept in
+# report_texts.ko.json. Tier 1 = 0~10%, Tier 2 = 11~20%, ... Tier 10 = 91~100%
+_REPORT_TEXTS_PATH = Path(__file__).with_name("report_texts.ko.json")
+
+
+@functools.cache
+def _skill_desc_flat() -> dict[tuple[str, int], str]:
+    """(skill key, tier) -> description, loaded on first use."""
+    with _REPORT_TEXTS_PATH.open(encoding="utf-8") as f:
+        texts = json.load(f)
+    return {
+        (key, int(tier)): desc
+        for key, tiers in texts["skill_descriptions"].items()
+        for tier, desc in tiers.items()
+    }
+
 
 # Legacy 4-axis metric names (kept for backward compatibility where needed)
 METRIC_NAMES: dict[str, str] = {
@@ -278,14 +243,11 @@ _ENGINE_CATEGORY: dict[str, str] = {
 # ---------------------------------------------------------------------------
 
 def _score_tier(score: float) -> int:
-    """Map 0-10 score to 1~10 tier (each tier = 10%)."""
-    tier = max(1, min(10, int(score) + 1))
-    # Edge case: exact 0 → tier 1, exact 10 → tier 10
-    if score <= 0:
-        return 1
-    if score >= 10:
-        return 10
-    return tier
+    """Map 0-10 score to 1~10 tier (each tier = 10%).
+
+    The clamp covers the edges: exact 0 (and below) → tier 1, exact 10 → tier 10.
+    """
+    return max(1, min(10, int(score) + 1))
 
 
 def calculate_speed_score(answers: list[dict]) -> tuple[float, float | None]:
@@ -295,15 +257,19 @@ def calculate_speed_score(answers: list[dict]) -> tuple[float, float | None]:
     Baseline: 0s→10, 30s→0, capped.
     Returns (score, avg_time_seconds).
     """
-    times = [
-        a["time_taken_seconds"]
-        for a in answers
-        if a.get("is_correct") and a.get("time_taken_seconds") is not None
-    ]
-    if not times:
+    # Single accumulating pass over correct, timed answers
+    count = 0
+    total = 0.0
+    for a in answers:
+        if a.get("is_correct"):
+            t = a.get("time_taken_seconds")
+            if t is not None:
+                total += t
+                count += 1
+    if not count:
         return 5.0, None
 
-    avg_time = round(sum(times) / len(times), 1)
+    avg_time = round(total / count, 1)
     score = max(0.0, min(10.0, 10.0 - (avg_time / 3.0)))
     return round(score, 1), avg_time
 
@@ -315,61 +281,119 @@ def calculate_accuracy_score(correct: int, total: int) -> float:
     return round((correct / total) * 10, 1)
 
 
-async def calculate_vocab_size(
-    db: AsyncSession, student_id: str,
-    determined_rank: int = 1,
-    test_answers: list[dict] | None = None,
-) -> tuple[int, float]:
-    """Calculate estimated vocabulary size and normalized 0-10 score.
+# Per-level word counts change only when words are imported or edited, so
+# reports share one GROUP BY per engine for _LEVEL_COUNT_TTL seconds.
+# Keyed weakly by the session's engine; word writes call invalidate_word_cache().
+_LEVEL_COUNT_TTL = 300
+_level_count_cache: "weakref.WeakKeyDictionary[object, tuple[dict[int, int], float]]" = (
+    weakref.WeakKeyDictionary()
+)
 
-    Cumulative approach based on curriculum position:
-    - Levels below determined_rank: all words assumed known
-    - At determined_rank: words * test accuracy (partial knowledge)
 
-    Returns (raw_count, normalized_score).
-    """
-    # Words in all levels below the determined rank (fully known)
-    words_below_q = (
-        select(func.count(Word.id))
-        .where(Word.level < determined_rank)
-    )
-    words_below_result = await db.execute(words_below_q)
-    words_below = words_below_result.scalar() or 0
+def invalidate_word_cache() -> None:
+    """Drop cached per-level word counts (call after word create/update/delete)."""
+    _level_count_cache.clear()
+
 
-    # Words at the determined rank level
-    words_at_rank_q = (
-        select(func.count(Word.id))
-        .where(Word.level == determined_rank)
+async def _get_level_counts(db: AsyncSession) -> dict[int, int]:
+    """Return {level: word count}, served from the TTL cache when fresh."""
+    bind = db.bind
+    entry = _level_count_cache.get(bind) if bind is not None else None
+    if entry is not None and time.time() - entry[1] <= _LEVEL_COUNT_TTL:
+        return entry[0]
+
+    result = await db.execute(
+        select(Word.level, func.count(Word.id))
+        .where(Word.level.isnot(None))
+        .group_by(Word.level)
     )
-    words_at_rank_result = await db.execute(words_at_rank_q)
-    words_at_rank = words_at_rank_result.scalar() or 0
+    counts = {level: count for level, count in result.all()}
+    if bind is not None:
+        _level_count_cache[bind] = (counts, time.time())
+    return counts
+
 
-    # Calculate accuracy at current rank from test answers
+async def _word_level_counts(db: AsyncSession, determined_rank: int) -> tuple[int, int, int, int]:
+    """Derive every word count the report needs from the cached level counts.
+
+    Returns (below, at_rank, scope, curriculum):
+    - below: levels below the determined rank (fully known)
+    - at_rank: words at the determined rank level
+    - scope: all levels up to rank+1, for normalization
+    - curriculum: levels 1-10 (same as get_total_word_count)
+    """
+    counts = await _get_level_counts(db)
+    scope_top = min(determined_rank + 1, 15)
+    below = at_rank = scope = curriculum = 0
+    for level, count in counts.items():
+        if level < determined_rank:
+            below += count
+        elif level == determined_rank:
+            at_rank += count
+        if level <= scope_top:
+            scope += count
+        if 1 <= level <= 10:
+            curriculum += count
+    return below, at_rank, scope, curriculum
+
+
+def _rank_answer_counts(test_answers: list[dict], determined_rank: int) -> tuple[int, int]:
+    """(answered, correct) among test answers at the determined rank level."""
+    answered_at_rank = correct_at_rank = 0
+    for a in test_answers:
+        if a.get("word_level") == determined_rank:
+            answered_at_rank += 1
+            if a.get("is_correct"):
+                correct_at_rank += 1
+    return answered_at_rank, correct_at_rank
+
+
+def _estimate_vocab_size(
+    words_below: int,
+    words_at_rank: int,
+    scope_words: int,
+    answered_at_rank: int,
+    correct_at_rank: int,
+) -> tuple[int, float]:
+    """Cumulative vocabulary estimate from level counts (see calculate_vocab_size)."""
+    # Accuracy at current rank from test answers
     current_rank_accuracy = 0.5  # default
-    if test_answers:
-        rank_answers = [
-            a for a in test_answers
-            if a.get("word_level") == determined_rank
-        ]
-        if rank_answers:
-            correct_at_rank = sum(1 for a in rank_answers if a.get("is_correct"))
-            current_rank_accuracy = correct_at_rank / len(rank_answers)
+    if answered_at_rank:
+        current_rank_accuracy = correct_at_rank / answered_at_rank
 
     # Cumulative estimate: all lower-level words + partial current level
     raw_count = words_below + int(words_at_rank * current_rank_accuracy)
 
     # Total words in scope for normalization (all levels up to rank+1)
-    scope_words_q = (
-        select(func.count(Word.id))
-        .where(Word.level <= min(determined_rank + 1, 15))
-    )
-    scope_result = await db.execute(scope_words_q)
-    scope_words = scope_result.scalar() or 1
+    scope_words = scope_words or 1
 
     normalized = min(10.0, round((raw_count / scope_words) * 10, 1))
     return raw_count, normalized
 
 
+async def calculate_vocab_size(
+    db: AsyncSession, student_id: str,
+    determined_rank: int = 1,
+    test_answers: list[dict] | None = None,
+) -> tuple[int, float]:
+    """Calculate estimated vocabulary size and normalized 0-10 score.
+
+    Cumulative approach based on curriculum position:
+    - Levels below determined_rank: all words assumed known
+    - At determined_rank: words * test accuracy (partial knowledge)
+
+    Returns (raw_count, normalized_score).
+    """
+    words_below, words_at_rank, scope_words, _ = await _word_level_counts(db, determined_rank)
+    # With no words at the rank level the accuracy can't change the
+    # estimate, so skip the scan
+    rank_counts = (
+        _rank_answer_counts(test_answers, determined_rank)
+        if test_answers and words_at_rank else (0, 0)
+    )
+    return _estimate_vocab_size(words_below, words_at_rank, scope_words, *rank_counts)
+
+
 async def calculate_peer_ranking(
     db: AsyncSession, student_id: str, score: int, grade: str | None
 ) -> dict | None:
@@ -383,9 +407,9 @@ async def calculate_peer_ranking(
     if not grade:
         return _estimate_peer_ranking(score)
 
-    # Find all completed test scores from students with same grade
-    peer_scores_q = (
-        select(func.max(TestSession.score))
+    # Best completed test score per same-grade student
+    peer_max = (
+        select(func.max(TestSession.score).label("best"))
         .join(User, TestSession.student_id == User.id)
         .where(
             and_(
@@ -396,52 +420,72 @@ async def calculate_peer_ranking(
             )
         )
         .group_by(TestSession.student_id)
+        .subquery()
     )
-    result = await db.execute(peer_scores_q)
-    peer_scores = [row[0] for row in result.fetchall() if row[0] is not None]
-
-    if len(peer_scores) < 2:
+    # Aggregate server-side so only (peers, peers above, peers tied) return
+    counts_q = select(
+        func.count(),
+        func.count().filter(peer_max.c.best > score),
+        func.count().filter(peer_max.c.best == score),
+    ).select_from(peer_max)
+    total_peers, better_count, equal_count = (await db.execute(counts_q)).one()
+
+    if total_peers < 2:
         # Not enough real peers → return estimated dummy ranking
         return _estimate_peer_ranking(score)
 
-    # Calculate percentile (higher score = lower percentile number = better)
-    better_count = sum(1 for s in peer_scores if s <= score)
-    percentile = max(1, round((1 - better_count / len(peer_scores)) * 100))
+    # Top-N% percentile from the mid-rank (rank - 0.5) / N: tied peers share
+    # the mean of their ranks, so both tails are treated alike. Floored at 1
+    # since it's shown as "상위 N%".
+    rank = better_count + (equal_count + 1) / 2
+    percentile = max(1, round((rank - 0.5) / total_peers * 100))
+
+    return {
+        "percentile": percentile,
+        "total_peers": total_peers,
+    }
+
+
+# (score floor, percentile low, percentile high) for the estimated ranking
+_ESTIMATE_PERCENTILE_BANDS: tuple[tuple[int, int, int], ...] = (
+    (90, 3, 10),
+    (80, 10, 25),
+    (70, 20, 40),
+    (60, 35, 55),
+    (50, 45, 65),
+    (40, 55, 75),
+)
+
+
+def _draw_peer_ranking(score: int) -> dict:
+    """Draw the estimated ranking for a score from a generator seeded by it."""
+    rng = random.Random(score)  # deterministic for same score
+    for floor, low, high in _ESTIMATE_PERCENTILE_BANDS:
+        if score >= floor:
+            percentile = rng.randint(low, high)
+            break
+    else:
+        percentile = rng.randint(70, 90)
 
     return {
         "percentile": percentile,
-        "total_peers": len(peer_scores),
+        "total_peers": rng.randint(95, 130),
     }
 
 
+# Every real score is 0-100, so the draws are made once at import
+_ESTIMATED_PEER_RANKINGS: tuple[dict, ...] = tuple(_draw_peer_ranking(s) for s in range(101))
+
+
 def _estimate_peer_ranking(score: int) -> dict:
     """Estimate peer ranking from score when real peer data is unavailable.
 
     Maps accuracy (0-100) to a plausible percentile among ~120 virtual peers.
     Higher score → lower percentile (= better rank).
     """
-    import random
-    random.seed(score)  # deterministic for same score
-
-    if score >= 90:
-        percentile = random.randint(3, 10)
-    elif score >= 80:
-        percentile = random.randint(10, 25)
-    elif score >= 70:
-        percentile = random.randint(20, 40)
-    elif score >= 60:
-        percentile = random.randint(35, 55)
-    elif score >= 50:
-        percentile = random.randint(45, 65)
-    elif score >= 40:
-        percentile = random.randint(55, 75)
-    else:
-        percentile = random.randint(70, 90)
-
-    return {
-        "percentile": percentile,
-        "total_peers": random.randint(95, 130),
-    }
+    if 0 <= score <= 100 and score == int(score):
+        return dict(_ESTIMATED_PEER_RANKINGS[int(score)])
+    return _draw_peer_ranking(score)
 
 
 async def calculate_member_averages(
@@ -453,39 +497,27 @@ async def calculate_member_averages(
     to a skill area via ENGINE_TO_SKILL, and returns real per-axis averages
     on a 0-10 scale.  Falls back to 5.0 when no peer data exists.
     """
-    # Get same-grade student IDs
-    filters = [User.role == "student", User.teacher_id == teacher_id]
+    # Same-grade students of this teacher
+    filters = [
+        User.role == "student",
+        User.teacher_id == teacher_id,
+        LearningSession.completed_at.isnot(None),
+        LearningAnswer.question_type.isnot(None),
+    ]
     if grade:
         filters.append(User.grade == grade)
-    student_ids_subq = (
-        select(User.id).where(and_(*filters)).scalar_subquery()
-    )
 
-    # Completed sessions by those students
-    session_ids_subq = (
-        select(LearningSession.id)
-        .where(
-            and_(
-                LearningSession.student_id.in_(student_ids_subq),
-                LearningSession.completed_at.isnot(None),
-            )
-        )
-        .scalar_subquery()
-    )
-
-    # Per-engine accuracy from LearningAnswer
+    # Per-engine accuracy from LearningAnswer in completed sessions, joined
+    # straight through to the student instead of nesting IN subqueries
     q = (
         select(
             LearningAnswer.question_type,
             func.count(LearningAnswer.id).label("total"),
             func.sum(func.cast(LearningAnswer.is_correct, Integer)).label("correct"),
         )
-        .where(
-            and_(
-                LearningAnswer.session_id.in_(session_ids_subq),
-                LearningAnswer.question_type.isnot(None),
-            )
-        )
+        .join(LearningSession, LearningAnswer.session_id == LearningSession.id)
+        .join(User, LearningSession.student_id == User.id)
+        .where(and_(*filters))
         .group_by(LearningAnswer.question_type)
     )
     result = await db.execute(q)
@@ -527,10 +559,8 @@ async def calculate_member_averages(
 
 async def get_total_word_count(db: AsyncSession) -> int:
     """Return total word count for levels 1-10 (curriculum scope)."""
-    result = await db.execute(
-        select(func.count(Word.id)).where(Word.level.between(1, 10))
-    )
-    return result.scalar() or 0
+    counts = await _get_level_counts(db)
+    return sum(count for level, count in counts.items() if 1 <= level <= 10)
 
 
 # ---------------------------------------------------------------------------
@@ -552,36 +582,79 @@ def infer_question_type(answer: dict) -> str | None:
     return None
 
 
+@dataclass(slots=True)
+class _AnswerAggregate:
+    """Everything a report reads from its answers, gathered in one pass."""
+
+    engines: dict[str, list]            # question_type -> [total, correct, time sum, timed count]
+    total_time: float
+    category_times: dict[str, float]    # skill area name (or 기타) -> seconds
+    answered_at_rank: int = 0
+    correct_at_rank: int = 0
+
+
+def _aggregate_answers(answers: list[dict], rank: int | None = None) -> _AnswerAggregate:
+    """Single pass over answers feeding per-engine stats, skill areas,
+    time breakdown and (when rank is given) rank-level accuracy.
+
+    Each answer's fields are read once; question types are inferred as in
+    infer_question_type.
+    """
+    engines: dict[str, list] = {}
+    categories: defaultdict[str, float] = defaultdict(float)
+    total_time = 0.0
+    answered_at_rank = correct_at_rank = 0
+    category_of = _ENGINE_CATEGORY.get
+    stage_engine = STAGE_ENGINE_MAP.get
+
+    for a in answers:
+        qt = a.get("question_type") or stage_engine(a.get("stage"))
+        correct = a.get("is_correct")
+        t = a.get("time_taken_seconds")
+
+        if qt:
+            bucket = engines.get(qt)
+            if bucket is None:
+                bucket = engines[qt] = [0, 0, 0.0, 0]
+            bucket[0] += 1
+            if correct:
+                bucket[1] += 1
+                # Running sums for the correct-answer average time
+                if t is not None:
+                    bucket[2] += t
+                    bucket[3] += 1
+
+        if t is not None:
+            total_time += t
+            # Untyped answers land in 기타
+            cat = category_of(qt, "기타")
+            categories[cat] += t
+
+        if rank is not None and a.get("word_level") == rank:
+            answered_at_rank += 1
+            if correct:
+                correct_at_rank += 1
+
+    return _AnswerAggregate(
+        engines, total_time, categories, answered_at_rank, correct_at_rank
+    )
+
+
 def calculate_per_engine_stats(answers: list[dict]) -> list[dict]:
     """Calculate per-engine accuracy, speed, and count.
 
     Returns list of dicts sorted by accuracy ascending (weakest first).
     Each dict: {engine, label, total, correct, accuracy_pct, avg_time_sec}.
     """
-    engine_data: dict[str, dict] = {}
-
-    for a in answers:
-        qt = infer_question_type(a)
-        if not qt:
-            continue
+    return _engine_stats(_aggregate_answers(answers).engines)
 
-        if qt not in engine_data:
-            engine_data[qt] = {"total": 0, "correct": 0, "times": []}
-
-        engine_data[qt]["total"] += 1
-        if a.get("is_correct"):
-            engine_data[qt]["correct"] += 1
-        t = a.get("time_taken_seconds")
-        if t is not None and a.get("is_correct"):
-            engine_data[qt]["times"].append(t)
 
+def _engine_stats(engines: dict[str, list]) -> list[dict]:
+    """calculate_per_engine_stats from already aggregated engine buckets."""
     results = []
-    for engine_name, data in engine_data.items():
-        total = data["total"]
-        correct = data["correct"]
-        times = data["times"]
+    for engine_name, (total, correct, time_sum, timed) in engines.items():
         accuracy_pct = round(correct / total * 100, 1) if total > 0 else 0.0
-        avg_time = round(sum(times) / len(times), 1) if times else None
+        avg_time = round(time_sum / timed, 1) if timed else None
 
         results.append({
             "engine": engine_name,
@@ -592,7 +665,7 @@ def calculate_per_engine_stats(answers: list[dict]) -> list[dict]:
             "avg_time_sec": avg_time,
         })
 
-    results.sort(key=lambda x: x["accuracy_pct"])
+    results.sort(key=itemgetter("accuracy_pct"))
     return results
 
 
@@ -605,17 +678,18 @@ def diagnose_strengths_weaknesses(
 
     Returns {"weaknesses": [...], "strengths": [...]}.
     Only includes engines with >= 2 questions for reliability.
+    Entries are the engine_stats dicts themselves (see calculate_per_engine_stats),
+    not copies.
     """
-    weaknesses = [
-        {"engine": s["engine"], "label": s["label"], "total": s["total"], "correct": s["correct"], "accuracy_pct": s["accuracy_pct"], "avg_time_sec": s.get("avg_time_sec")}
-        for s in engine_stats
-        if s["accuracy_pct"] < threshold_weak and s["total"] >= 2
-    ]
-    strengths = [
-        {"engine": s["engine"], "label": s["label"], "total": s["total"], "correct": s["correct"], "accuracy_pct": s["accuracy_pct"], "avg_time_sec": s.get("avg_time_sec")}
-        for s in engine_stats
-        if s["accuracy_pct"] >= threshold_strong and s["total"] >= 2
-    ]
+    weaknesses = []
+    strengths = []
+    for s in engine_stats:
+        if s["total"] < 2:
+            continue
+        if s["accuracy_pct"] < threshold_weak:
+            weaknesses.append(s)
+        if s["accuracy_pct"] >= threshold_strong:
+            strengths.append(s)
     return {"weaknesses": weaknesses, "strengths": strengths}
 
 
@@ -624,22 +698,18 @@ def calculate_time_breakdown(answers: list[dict]) -> tuple[int | None, dict[str,
 
     Returns (total_seconds, {"단어": secs, "리스닝": secs, ...}).
     """
-    total = 0.0
-    categories: dict[str, float] = {}
+    return _time_breakdown(_aggregate_answers(answers))
 
-    for a in answers:
-        t = a.get("time_taken_seconds")
-        if t is None:
-            continue
-        total += t
-        qt = infer_question_type(a)
-        cat = _ENGINE_CATEGORY.get(qt, "기타") if qt else "기타"
-        categories[cat] = categories.get(cat, 0.0) + t
+
+def _time_breakdown(agg: "_AnswerAggregate") -> tuple[int | None, dict[str, int]]:
+    """calculate_time_breakdown from an answer aggregate."""
+    total = agg.total_time
+    categories = agg.category_times
 
     if total == 0:
         return None, {}
 
-    return round(total), {k: round(v) for k, v in categories.items() if round(v) > 0}
+    return round(total), {k: secs for k, v in categories.items() if (secs := round(v)) > 0}
 
 
 def session_duration_seconds(
@@ -661,18 +731,19 @@ def calculate_skill_area_scores(answers: list[dict]) -> dict[str, float]:
     Comprehensive uses sentence_type data when available, otherwise weighted avg of other areas.
     Returns dict with keys: meaning, association, listening, inference, spelling, comprehensive.
     """
+    return _skill_area_scores(_aggregate_answers(answers).engines)
+
+
+def _skill_area_scores(engines: dict[str, list]) -> dict[str, float]:
+    """calculate_skill_area_scores from already aggregated engine buckets."""
     skill_data: dict[str, dict] = {k: {"total": 0, "correct": 0} for k in SKILL_AREA_KEYS}
 
-    for a in answers:
-        qt = infer_question_type(a)
-        if not qt:
-            continue
+    for qt, (total, correct, _, _) in engines.items():
         skill = ENGINE_TO_SKILL.get(qt)
         if not skill:
             continue
-        skill_data[skill]["total"] += 1
-        if a.get("is_correct"):
-            skill_data[skill]["correct"] += 1
+        skill_data[skill]["total"] += total
+        skill_data[skill]["correct"] += correct
 
     scores: dict[str, float] = {}
     # Track non-comprehensive areas for fallback weighted average
@@ -698,6 +769,25 @@ def calculate_skill_area_scores(answers: list[dict]) -> dict[str, float]:
     return scores
 
 
+# MetricDetail skeletons per (skill key, tier); callers get a copy with
+# my_score filled in (avg_score/raw_value are filled by the caller).
+@functools.cache
+def _detail_templates() -> dict[tuple[str, int], dict]:
+    descriptions = _skill_desc_flat()
+    return {
+        (key, tier): {
+            "key": key,
+            "name": SKILL_AREA_NAMES.get(key, key),
+            "my_score": 0.0,
+            "avg_score": 0.0,
+            "description": descriptions.get((key, tier), ""),
+            "raw_value": None,
+        }
+        for key in SKILL_AREA_KEYS
+        for tier in range(1, 11)
+    }
+
+
 def get_metric_descriptions(
     rank: int, metrics: dict[str, float]
 ) -> list[dict]:
@@ -705,29 +795,83 @@ def get_metric_descriptions(
 
     Returns list of MetricDetail dicts for all 6 skill areas.
     """
-    details = []
-
-    for key in SKILL_AREA_KEYS:
-        score = metrics.get(key, 0.0)
-        tier = _score_tier(score)
-        desc = _SKILL_DESC.get(key, {}).get(tier, "")
+    scores = [metrics.get(key, 0.0) for key in SKILL_AREA_KEYS]
+    templates = _tier_templates(tuple(map(_score_tier, scores)))
+    return [
+        {**template, "my_score": score}
+        for template, score in zip(templates, scores)
+    ]
 
-        details.append({
-            "key": key,
-            "name": SKILL_AREA_NAMES.get(key, key),
-            "my_score": score,
-            "avg_score": 0.0,  # filled by caller
-            "description": desc,
-            "raw_value": None,  # filled by caller
-        })
 
-    return details
+@functools.lru_cache(maxsize=1024)
+def _tier_templates(tiers: tuple[int, ...]) -> tuple[dict, ...]:
+    """MetricDetail templates for one tier per SKILL_AREA_KEYS entry, in order."""
+    templates = _detail_templates()
+    return tuple(templates[(key, tier)] for key, tier in zip(SKILL_AREA_KEYS, tiers))
 
 
 # ---------------------------------------------------------------------------
 # Consolidated report assembly
 # ---------------------------------------------------------------------------
 
+def _can_overlap_queries(db: AsyncSession) -> bool:
+    """True when sibling sessions on db's engine get their own connections."""
+    return db.bind is not None and db.bind.dialect.name != "sqlite"
+
+
+@dataclass(slots=True)
+class ReportMetrics:
+    """Everything assemble_report_metrics computes for one report."""
+
+    radar: dict[str, float]
+    metric_details: list[dict]
+    peer_ranking: dict | None
+    grade_level: str
+    vocab_description: str
+    recommended_book: str
+    total_time_seconds: int | None
+    category_times: dict[str, int]
+    per_engine_stats: list[dict]
+    diagnosis: dict
+    vocab_raw: int
+    total_word_count: int
+    book_series: str
+
+
+async def _gather_report_queries(
+    db: AsyncSession,
+    student_id: str,
+    teacher_id: str | None,
+    student_grade: str | None,
+    rank: int,
+    score: int,
+) -> tuple[dict, dict[str, float], tuple[int, int, int, int]]:
+    """Run the report's DB lookups: peer ranking, member averages, level counts.
+
+    On server databases each lookup gets its own session so they overlap and
+    the report waits for the slowest one instead of the sum. SQLite shares a
+    single connection across sessions, so there they run on ``db`` in turn.
+    """
+    async def averages(session: AsyncSession) -> dict[str, float]:
+        if not teacher_id:
+            return {k: 5.0 for k in SKILL_AREA_KEYS}
+        return await calculate_member_averages(session, teacher_id, grade=student_grade)
+
+    lookups = (
+        lambda s: calculate_peer_ranking(s, student_id, score, student_grade),
+        averages,
+        lambda s: _word_level_counts(s, rank),
+    )
+    if not _can_overlap_queries(db):
+        return tuple([await lookup(db) for lookup in lookups])
+
+    async def run(lookup):
+        async with sibling_session(db) as session:
+            return await lookup(session)
+
+    return tuple(await asyncio.gather(*(run(lookup) for lookup in lookups)))
+
+
 async def assemble_report_metrics(
     db: AsyncSession,
     student_id: str,
@@ -739,42 +883,40 @@ async def assemble_report_metrics(
     total_questions: int,
     answers: list[dict],
     book_series: str = "power",
-) -> dict:
+) -> ReportMetrics:
     """Consolidated report metric assembly used by all report endpoints.
 
-    Returns dict with keys: radar, metric_details, peer_ranking, grade_level,
-    vocab_description, recommended_book, total_time_seconds, category_times,
-    per_engine_stats, diagnosis, vocab_raw.
+    Returns a ReportMetrics with radar, metric_details, peer_ranking,
+    grade_level, vocab_description, recommended_book, total_time_seconds,
+    category_times, per_engine_stats, diagnosis, vocab_raw, total_word_count
+    and book_series.
 
     Radar uses 6 skill area axes: meaning, association, listening, inference,
     spelling, comprehensive (sentence_type engine, or weighted avg fallback).
     """
-    # Skill area scores (6 axes)
-    radar = calculate_skill_area_scores(answers)
+    # One pass over the answers feeds every answer-derived metric below
+    agg = _aggregate_answers(answers, rank)
 
-    # Peer ranking
-    peer = await calculate_peer_ranking(db, student_id, score, student_grade)
+    # Skill area scores (6 axes)
+    radar = _skill_area_scores(agg.engines)
 
-    # Same-grade averages (now skill-area based)
-    if teacher_id:
-        avg_metrics = await calculate_member_averages(
-            db, teacher_id, grade=student_grade
-        )
-    else:
-        avg_metrics = {k: 5.0 for k in SKILL_AREA_KEYS}
+    # Peer ranking, same-grade averages (skill-area based) and word level
+    # counts are independent reads
+    peer, avg_metrics, level_counts = await _gather_report_queries(
+        db, student_id, teacher_id, student_grade, rank, score
+    )
 
     # Metric details with descriptions + real per-axis grade averages
-    details_raw = get_metric_descriptions(rank, radar)
-    metric_details = []
-    for d in details_raw:
-        d["avg_score"] = avg_metrics.get(d["key"], 5.0)
-        metric_details.append(d)
+    metric_details = get_metric_descriptions(rank, radar)
+    avg_score = avg_metrics.get
+    for d in metric_details:
+        d["avg_score"] = avg_score(d["key"], 5.0)
 
     # Time breakdown (by skill area category)
-    total_time, cat_times = calculate_time_breakdown(answers)
+    total_time, cat_times = _time_breakdown(agg)
 
     # Per-engine stats and diagnosis
-    engine_stats = calculate_per_engine_stats(answers)
+    engine_stats = _engine_stats(agg.engines)
     diagnosis = diagnose_strengths_weaknesses(engine_stats)
 
     # Mappings (series-aware)
@@ -785,26 +927,28 @@ async def assemble_report_metrics(
         vocab_desc = f"{vocab_label} {score}% 이해"
         recommended_book = NEUNGYUL_RANK_TO_BOOK.get(ng_rank, "")
     else:
-        grade_level = RANK_TO_GRADE.get(rank, "미정")
-        vocab_desc = get_vocab_description(rank, score)
-        recommended_book = RANK_TO_BOOK.get(rank, "")
+        grade_level, vocab_label, recommended_book = _rank_row(rank)
+        vocab_desc = f"{vocab_label} {score}% 이해"
 
-    # Legacy values for backward compat
-    vocab_raw, _ = await calculate_vocab_size(
-        db, student_id, determined_rank=rank, test_answers=answers
+    # Legacy values for backward compat; the curriculum total rides along
+    # in the same query so callers don't need get_total_word_count
+    words_below, words_at_rank, scope_words, total_word_count = level_counts
+    vocab_raw, _ = _estimate_vocab_size(
+        words_below, words_at_rank, scope_words, agg.answered_at_rank, agg.correct_at_rank
     )
 
-    return {
-        "radar": radar,
-        "metric_details": metric_details,
-        "peer_ranking": peer,
-        "grade_level": grade_level,
-        "vocab_description": vocab_desc,
-        "recommended_book": recommended_book,
-        "total_time_seconds": total_time,
-        "category_times": cat_times,
-        "per_engine_stats": engine_stats,
-        "diagnosis": diagnosis,
-        "vocab_raw": vocab_raw,
-        "book_series": book_series,
-    }
+    return ReportMetrics(
+        radar=radar,
+        metric_details=metric_details,
+        peer_ranking=peer,
+        grade_level=grade_level,
+        vocab_description=vocab_desc,
+        recommended_book=recommended_book,
+        total_time_seconds=total_time,
+        category_times=cat_times,
+        per_engine_stats=engine_stats,
+        diagnosis=diagnosis,
+        vocab_raw=vocab_raw,
+        total_word_count=total_word_count,
+        book_series=book_series,
+    )
@@ -299,20 +299,60 @@ async def compute_accuracy(db: AsyncSession, session_id: str) -> tuple[int, int,
     return total_count, int(correct_count), accuracy
 
 
-async def mark_assignment_completed(
-    db: AsyncSession,
-    assignment_id: str,
-) -> None:
-    """Mark a TestAssignment as completed."""
-    result = await db.execute(
-        select(TestAssignment).where(TestAssignment.id == assignment_id)
-    )
-    assignment = result.scalar_one_or_none()
+def complete_assignment(assignment: TestAssignment | None) -> None:
+    """Mark an already loaded TestAssignment as completed (None is ignored)."""
     if assignment and assignment.status != "completed":
         assignment.status = "completed"
         assignment.completed_at = now_kst()
 
 
+async def get_session_and_assignment(
+    db: AsyncSession, session_id: str
+) -> tuple[LearningSession, TestAssignment | None]:
+    """Load a learning session with its assignment in one query.
+
+    Raises ValueError if the session is not found.
+    """
+    result = await db.execute(
+        select(LearningSession, TestAssignment)
+        .outerjoin(TestAssignment, TestAssignment.id == LearningSession.assignment_id)
+        .where(LearningSession.id == session_id)
+    )
+    row = result.first()
+    if not row:
+        raise ValueError("Session not found")
+    return row[0], row[1]
+
+
+async def get_answer_context(
+    db: AsyncSession,
+    session_id: str,
+    word_mastery_id: str,
+    with_examples: bool = False,
+) -> tuple[WordMastery, Word, LearningSession | None]:
+    """Load the mastery record, its word and the session for one answer.
+
+    One round trip instead of three lookups. The session may be missing
+    (callers then skip its counters). Raises ValueError if the mastery
+    record or its word is not found.
+    """
+    q = (
+        select(WordMastery, Word, LearningSession)
+        .outerjoin(Word, Word.id == WordMastery.word_id)
+        .outerjoin(LearningSession, LearningSession.id == session_id)
+        .where(WordMastery.id == word_mastery_id)
+    )
+    if with_examples:
+        q = q.options(selectinload(Word.examples))
+    row = (await db.execute(q)).first()
+    if not row:
+        raise ValueError("Word mastery record not found")
+    mastery, word, session = row
+    if not word:
+        raise ValueError("Word not found")
+    return mastery, word, session
+
+
 # ── Loanword Detection ───────────────────────────────────────────────────────
 
 _HANGUL_BASE = 0xAC00
@@ -609,27 +649,19 @@ def generate_questions_for_words(
 
     def _build_question(word: Word, qtype: str) -> dict | None:
         """Build a single question dict for a word and question type, with fallback."""
-        engine = get_engine(qtype)
-        if not engine.can_generate(word):
-            found = False
+        spec = get_engine(qtype).try_generate(word, pool)
+        if spec is None:
             for alt in question_types:
                 if alt == qtype:
                     continue
-                alt_engine = get_engine(alt)
-                if alt_engine.can_generate(word):
-                    qtype_used = alt
-                    engine = alt_engine
-                    found = True
+                spec = get_engine(alt).try_generate(word, pool)
+                if spec is not None:
                     break
-            if not found:
-                qtype_used = "en_to_ko"
-                engine = get_engine(qtype_used)
-                if not engine.can_generate(word):
+            else:
+                spec = get_engine("en_to_ko").try_generate(word, pool)
+                if spec is None:
                     return None
-        else:
-            qtype_used = qtype
 
-        spec = engine.generate(word, pool)
         mastery = mastery_map.get(word.id)
         q_example_en = spec.sentence_en or word.example_en
         q_example_ko = spec.sentence_ko or word.example_ko
@@ -15,7 +15,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
 from app.models.word import Word
-from app.services.question_engines import ENGINES, compute_compatible_engines
+from app.services.question_engines import ENGINE_NAMES, compute_compatible_engines
 
 
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
@@ -37,7 +37,7 @@ async def main():
         words = result.scalars().all()
 
         total = len(words)
-        engine_names = list(ENGINES.keys())
+        engine_names = list(ENGINE_NAMES)
         counts: dict[str, int] = {name: 0 for name in engine_names}
         book_counts: dict[str, dict[str, int]] = defaultdict(lambda: {name: 0 for name in engine_names})
         level_counts: dict[int, dict[str, int]] = defaultdict(lambda: {name: 0 for name in engine_names})
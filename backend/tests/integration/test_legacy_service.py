@@ -4,6 +4,8 @@ Tests the full legacy test engine flow: start session, submit answers, complete
 """
 import pytest
 
+from app.models.learning_session import LearningSession
+from app.models.word_mastery import WordMastery
 from app.services import legacy_service
 
 
@@ -92,6 +94,34 @@ class TestSubmitAnswer:
         assert answer_result["is_correct"] is False
         assert answer_result["correct_answer"] == q["correct_answer"]
 
+    @pytest.mark.asyncio
+    async def test_submit_updates_counters(self, db_session, legacy_assignment, sample_words):
+        """Submitting updates the mastery record and session counters."""
+        result = await legacy_service.start_session(db_session, "LG0001")
+        q = result["questions"][0]
+
+        await legacy_service.submit_answer(
+            db_session,
+            result["session_id"],
+            q["word_mastery_id"],
+            q["correct_answer"],
+            question_type=q["question_type"],
+        )
+
+        mastery = await db_session.get(WordMastery, q["word_mastery_id"])
+        session = await db_session.get(LearningSession, result["session_id"])
+        assert (mastery.total_attempts, mastery.total_correct) == (1, 1)
+        assert (session.words_practiced, session.words_advanced) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_submit_unknown_mastery(self, db_session, legacy_assignment, sample_words):
+        """Submit with bad word_mastery_id raises ValueError."""
+        result = await legacy_service.start_session(db_session, "LG0001")
+        with pytest.raises(ValueError, match="Word mastery record not found"):
+            await legacy_service.submit_answer(
+                db_session, result["session_id"], "bad-mastery-id", "x"
+            )
+
 
 # ── TestCompleteSession ───────────────────────────────────────────────────────
 
@@ -130,6 +160,7 @@ class TestCompleteSession:
         assert complete_result["total_answered"] == 10
         assert complete_result["correct_count"] == 5
         assert complete_result["accuracy"] == 50.0
+        assert legacy_assignment.status == "completed"
 
     @pytest.mark.asyncio
     async def test_complete_not_found(self, db_session):
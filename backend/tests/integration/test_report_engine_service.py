@@ -0,0 +1,249 @@
+"""Integration tests for report_engine DB queries with real DB.
+
+Covers the async metric helpers against SQLite in-memory data.
+"""
+import uuid
+
+import pytest
+from app.core.timezone import now_kst
+from app.models.learning_answer import LearningAnswer
+from app.models.learning_session import LearningSession
+from app.models.test_session import TestSession as SessionRecord
+from app.models.user import User
+from app.services import report_engine
+
+
+class TestVocabSize:
+    """Test calculate_vocab_size level counting."""
+
+    @pytest.mark.asyncio
+    async def test_counts_levels_below_and_at_rank(self, db_session, sample_words):
+        """Levels below rank count fully, the rank level by test accuracy."""
+        answers = [
+            {"word_level": 3, "is_correct": True},
+            {"word_level": 3, "is_correct": False},
+        ]
+        raw, normalized = await report_engine.calculate_vocab_size(
+            db_session, "student", determined_rank=3, test_answers=answers
+        )
+        # 20 words in levels 1-2 + half of the 10 words at level 3;
+        # scope is levels 1-4 (40 words)
+        assert raw == 25
+        assert normalized == 6.2
+
+    @pytest.mark.asyncio
+    async def test_empty_word_table(self, db_session):
+        """No words should give a zero estimate without dividing by zero."""
+        raw, normalized = await report_engine.calculate_vocab_size(db_session, "student")
+        assert raw == 0
+        assert normalized == 0.0
+
+    @pytest.mark.asyncio
+    async def test_level_counts_include_curriculum_total(self, db_session, sample_words):
+        """The fused count query should match get_total_word_count."""
+        counts = await report_engine._word_level_counts(db_session, 2)
+        assert counts == (10, 10, 30, await report_engine.get_total_word_count(db_session))
+
+    @pytest.mark.asyncio
+    async def test_level_counts_cached_until_invalidated(self, db_session, sample_words):
+        """Level counts should be reused until invalidate_word_cache is called."""
+        assert (await report_engine._get_level_counts(db_session))[1] == 10
+        await db_session.delete(sample_words[0])
+        await db_session.commit()
+        assert (await report_engine._get_level_counts(db_session))[1] == 10
+        assert await report_engine.get_total_word_count(db_session) == 50
+        report_engine.invalidate_word_cache()
+        assert (await report_engine._get_level_counts(db_session))[1] == 9
+        assert await report_engine.get_total_word_count(db_session) == 49
+
+
+class TestPeerRanking:
+    """Test calculate_peer_ranking against real same-grade sessions."""
+
+    async def _add_peer(self, db_session, name: str, scores: list[int | None], grade: str = "중3"):
+        user = User(
+            id=str(uuid.uuid4()), username=name, password_hash="x",
+            name=name, role="student", grade=grade,
+        )
+        db_session.add(user)
+        for s in scores:
+            db_session.add(SessionRecord(
+                student_id=user.id, test_type="placement", total_questions=10,
+                score=s, completed_at=now_kst(),
+            ))
+        await db_session.commit()
+
+    @pytest.mark.asyncio
+    async def test_percentile_uses_best_score_per_peer(self, db_session):
+        """Each peer counts once with their best completed score."""
+        await self._add_peer(db_session, "p1", [40, 90])
+        await self._add_peer(db_session, "p2", [60])
+        await self._add_peer(db_session, "p3", [70])
+        await self._add_peer(db_session, "p4", [95], grade="고1")
+
+        result = await report_engine.calculate_peer_ranking(db_session, "me", 70, "중3")
+        # peers: 90, 60, 70 → one above, one tied: rank 2, (2 - 0.5) / 3
+        assert result == {"percentile": 50, "total_peers": 3}
+
+    @pytest.mark.asyncio
+    async def test_ties_share_mean_rank(self, db_session):
+        """Peers tied with the score split the ranks they occupy."""
+        for i in range(4):
+            await self._add_peer(db_session, f"p{i}", [80])
+
+        result = await report_engine.calculate_peer_ranking(db_session, "me", 80, "중3")
+        # all four tied: rank 2.5, (2.5 - 0.5) / 4
+        assert result["percentile"] == 50
+
+    @pytest.mark.asyncio
+    async def test_ignores_unscored_and_incomplete_sessions(self, db_session):
+        """Peers without a completed, scored session are not counted."""
+        await self._add_peer(db_session, "p1", [50])
+        await self._add_peer(db_session, "p2", [60])
+        await self._add_peer(db_session, "p3", [None])
+        user = User(
+            id=str(uuid.uuid4()), username="p4", password_hash="x",
+            name="p4", role="student", grade="중3",
+        )
+        db_session.add(user)
+        db_session.add(SessionRecord(
+            student_id=user.id, test_type="placement", total_questions=10, score=99,
+        ))
+        await db_session.commit()
+
+        result = await report_engine.calculate_peer_ranking(db_session, "me", 55, "중3")
+        assert result["total_peers"] == 2
+
+    @pytest.mark.asyncio
+    async def test_too_few_peers_falls_back_to_estimate(self, db_session):
+        """Fewer than two peers should use the deterministic estimate."""
+        await self._add_peer(db_session, "p1", [80])
+        result = await report_engine.calculate_peer_ranking(db_session, "me", 80, "중3")
+        assert result == report_engine._estimate_peer_ranking(80)
+
+    def test_estimate_leaves_global_random_alone(self):
+        """The estimate is deterministic per score without reseeding random."""
+        import random
+
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        first = report_engine._estimate_peer_ranking(85)
+        assert random.random() == expected
+        assert report_engine._estimate_peer_ranking(85) == first
+        assert 10 <= first["percentile"] <= 25
+
+
+class TestMemberAverages:
+    """Test calculate_member_averages over learning answers."""
+
+    @pytest.mark.asyncio
+    async def test_averages_only_completed_sessions_of_teachers_grade(
+        self, db_session, teacher_user, student_user, sample_words
+    ):
+        """Only the teacher's same-grade students' completed sessions count."""
+        other = User(
+            id=str(uuid.uuid4()), username="other", password_hash="x", name="other",
+            role="student", teacher_id=teacher_user.id, grade="고1",
+        )
+        db_session.add(other)
+        done = LearningSession(student_id=student_user.id, completed_at=now_kst())
+        open_ = LearningSession(student_id=student_user.id)
+        other_done = LearningSession(student_id=other.id, completed_at=now_kst())
+        db_session.add_all([done, open_, other_done])
+        await db_session.flush()
+
+        word_id = sample_words[0].id
+        for session, qt, correct in [
+            (done, "en_to_ko", True), (done, "en_to_ko", False),
+            (done, "listen_ko", True), (open_, "en_to_ko", False),
+            (other_done, "en_to_ko", False),
+        ]:
+            db_session.add(LearningAnswer(
+                session_id=session.id, word_id=word_id, stage=1,
+                is_correct=correct, correct_answer="x", question_type=qt,
+            ))
+        await db_session.commit()
+
+        scores = await report_engine.calculate_member_averages(
+            db_session, teacher_user.id, grade="중3"
+        )
+        assert scores["meaning"] == 5.0      # en_to_ko: 1 of 2
+        assert scores["listening"] == 10.0   # listen_ko: 1 of 1
+        assert scores["comprehensive"] == 6.7
+
+
+class TestAssembleReportMetrics:
+    """Test assemble_report_metrics end to end on the test database."""
+
+    @pytest.mark.asyncio
+    async def test_assembles_report(self, db_session, sample_words, teacher_user, student_user):
+        """Answer-derived and DB-derived metrics land on one ReportMetrics."""
+        answers = [
+            {"question_type": "en_to_ko", "is_correct": True, "time_taken_seconds": 4.0, "word_level": 2},
+            {"question_type": "en_to_ko", "is_correct": True, "time_taken_seconds": 6.0, "word_level": 2},
+            {"question_type": "ko_type", "is_correct": False, "time_taken_seconds": 10.0, "word_level": 2},
+        ]
+        metrics = await report_engine.assemble_report_metrics(
+            db_session, student_user.id, teacher_user.id, student_user.grade,
+            rank=2, score=67, correct_count=2, total_questions=3, answers=answers,
+        )
+
+        assert isinstance(metrics, report_engine.ReportMetrics)
+        assert metrics.radar["meaning"] == 10.0
+        assert metrics.radar["spelling"] == 0.0
+        assert metrics.total_time_seconds == 20
+        assert metrics.per_engine_stats[0]["engine"] == "ko_type"
+        assert metrics.grade_level == report_engine.RANK_TO_GRADE[2]
+        assert metrics.vocab_description.endswith("67% 이해")
+        # 10 words at level 1 + 2/3 of the 10 at level 2
+        assert metrics.vocab_raw == 16
+        assert metrics.total_word_count == 50
+        assert metrics.book_series == "power"
+
+
+class TestGatherReportQueries:
+    """Test the concurrent report lookups in assemble_report_metrics."""
+
+    def _add_peers(self, db):
+        for name, score in (("p1", 60), ("p2", 80)):
+            user = User(
+                id=str(uuid.uuid4()), username=name, password_hash="x",
+                name=name, role="student", grade="중3", teacher_id="t1",
+            )
+            db.add(user)
+            db.add(SessionRecord(
+                student_id=user.id, test_type="placement", total_questions=10,
+                score=score, completed_at=now_kst(),
+            ))
+
+    @pytest.mark.asyncio
+    async def test_sibling_sessions_match_sequential(self, tmp_path, monkeypatch):
+        """Overlapping lookups on sibling sessions return the sequential results."""
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+        from app.db.base import Base
+        from app.models.word import Word
+
+        # A file database gives each session its own connection
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'report.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+                db.add_all(
+                    Word(english=f"w{i}", korean=f"뜻{i}", level=i % 5 + 1) for i in range(20)
+                )
+                self._add_peers(db)
+                await db.commit()
+
+                args = (db, "me", "t1", "중3", 3, 70)
+                sequential = await report_engine._gather_report_queries(*args)
+                monkeypatch.setattr(report_engine, "_can_overlap_queries", lambda db: True)
+                report_engine.invalidate_word_cache()
+                overlapped = await report_engine._gather_report_queries(*args)
+        finally:
+            await engine.dispose()
+
+        assert overlapped == sequential
+        assert sequential[0]["total_peers"] == 2
+        assert sequential[2] == (8, 4, 16, 20)
@@ -15,6 +15,7 @@ from unittest.mock import MagicMock
 
 from app.services.question_engines import (
     ENGINES,
+    ENGINE_NAMES,
     get_engine,
     resolve_name,
     build_pool,
@@ -100,6 +101,27 @@ class TestEngineRegistry:
         }
         assert set(ENGINES.keys()) == expected
 
+    def test_engine_names_match_registry(self):
+        """ENGINE_NAMES should list registry keys in order without loading engines."""
+        assert ENGINE_NAMES == tuple(ENGINES)
+        assert get_engine("emoji") is ENGINES["emoji"]
+
+    def test_report_eligibility_matches_can_generate(self):
+        """generate_report's shared masks should agree with each engine's can_generate."""
+        from app.services.question_engines.report import generate_report
+
+        words = [
+            make_word("run", "달리다", examples=[make_example("He ran home.", "그는 집으로 달렸다.")]),
+            make_word("give off", "내뿜다", example_en="The flower gives off a smell."),
+            make_word("apple", None, example_en="No match here."),
+            make_word("", "빈 단어"),
+        ]
+        words[2].antonym = None
+        report = generate_report(words)
+        for er in report.engine_reports:
+            engine = ENGINES[er.canonical_name]
+            assert er.eligible_count == sum(engine.can_generate(w) for w in words), er.canonical_name
+
     def test_get_engine_canonical(self):
         """get_engine should work with canonical names."""
         engine = get_engine("en_to_ko")
@@ -194,6 +216,35 @@ class TestDistractors:
         assert len(distractors) == 3
         assert all(d in all_english for d in distractors)
 
+    def test_tier_cache_shared_across_calls(self, sample_words):
+        """Repeated picks for the same word should reuse the pool's ranked tiers."""
+        for i, w in enumerate(sample_words):
+            w.level = 1 + i % 3
+            w.part_of_speech = "n"
+        pool = build_pool(sample_words)
+        word = sample_words[0]
+
+        first = pick_korean_distractors(word.korean, pool, count=3, source_word=word)
+        cached = dict(pool.tier_cache)
+        second = pick_korean_distractors(word.korean, pool, count=3, source_word=word)
+
+        assert len(first) == len(second) == 3
+        assert word.korean not in second
+        assert cached and pool.tier_cache == cached
+
+    def test_level_tiers_keep_pool_order(self, sample_words):
+        """Level-range tiers should list words in pool order, not bucket order."""
+        from app.services.question_engines.distractors import _words_near_level
+
+        levels = [3, 1, 2, 5, 1, 3, 2, 4, 1, 2]
+        for w, level in zip(sample_words, levels):
+            w.level = level
+        pool = build_pool(sample_words)
+
+        for k in (1, 2, 3):
+            expected = [w for w in sample_words if abs(w.level - 2) <= k]
+            assert _words_near_level(pool, 2, k) == expected
+
     def test_shuffle_all_present(self):
         """shuffle_choices should contain correct + all distractors."""
         correct = "dog"
@@ -220,6 +271,34 @@ class TestDistractors:
         assert "새" in pool.all_korean
         assert len(pool.all_words) == 3
 
+    def test_build_pool_precomputes_patterns(self):
+        """DistractorPool should precompute tilde meanings and phrase entries."""
+        pool = build_pool([
+            make_word("eat", "~을 먹다"),
+            make_word("give off", "내뿜다"),
+            make_word("dog", "개"),
+        ])
+        assert pool.tilde_korean == frozenset({"~을 먹다"})
+        assert pool.phrase_english == frozenset({"give off"})
+
+    def test_prebuilt_scorers_match_confusion_scores(self):
+        """Per-target scorers should score exactly like the two-argument scorers."""
+        from app.services.question_engines.distractors import (
+            _english_confusion_score, _korean_confusion_score,
+            _make_english_scorer, _make_korean_scorer,
+        )
+
+        english = ["station", "nation", "quickly", "slowly", "a", "", "  Run "]
+        for correct in english:
+            scorer = _make_english_scorer(correct)
+            for candidate in english:
+                assert scorer(candidate) == _english_confusion_score(candidate, correct)
+        korean = ["공부하다", "~을 공부하다", "행복한", "행", "", "~", "감정적인"]
+        for correct in korean:
+            scorer = _make_korean_scorer(correct)
+            for candidate in korean:
+                assert scorer(candidate) == _korean_confusion_score(candidate, correct)
+
 
 # ══════════════════════════════════════════════════════════════════════════
 # TestEnToKo
@@ -329,6 +408,19 @@ class TestEmoji:
         assert spec.emoji == "🐕"
         assert spec.is_typing is False
 
+    def test_try_generate_mapped_word(self, sample_pool):
+        """try_generate should build the same spec as generate for mapped words."""
+        engine = get_engine("emoji")
+        spec = engine.try_generate(make_word("dog", "개"), sample_pool)
+        assert spec is not None
+        assert spec.emoji == "🐕"
+        assert "dog" in spec.choices
+
+    def test_try_generate_unmapped_word(self, sample_pool):
+        """try_generate should return None for words without emoji mappings."""
+        engine = get_engine("emoji")
+        assert engine.try_generate(make_word("philosophy", "철학"), sample_pool) is None
+
 
 # ══════════════════════════════════════════════════════════════════════════
 # TestSentence
@@ -356,6 +448,22 @@ class TestSentence:
         word = make_word("dog", "개", "I have a cat.")  # dog not in sentence
         assert engine.can_generate(word) is False
 
+    def test_warm_precompiles_patterns(self):
+        """warm should fill the pattern caches so later blanking only searches."""
+        from app.services.question_engines.sentence import _compile_exact
+
+        engine = get_engine("sentence")
+        engine.warm([make_word("zebra", "얼룩말"), make_word("give off", "내뿜다")])
+        misses = _compile_exact.cache_info().misses
+        assert make_sentence_blank("Zebras run.", "zebra") == "____ run."
+        assert make_sentence_blank("It gave off smoke.", "give off") == "It ____ smoke."
+        assert _compile_exact.cache_info().misses == misses
+
+    def test_make_sentence_blank_ignorecase_aliases(self):
+        """Non-ASCII letters IGNORECASE matches (İ, ſ) must not be prefiltered away."""
+        assert make_sentence_blank("İt was late.", "it") == "____ was late."
+        assert make_sentence_blank("The ſun is hot.", "sun") == "The ____ is hot."
+
     def test_make_sentence_blank(self):
         """make_sentence_blank should replace target word with ____."""
         sentence = "I have a dog."
@@ -430,6 +538,30 @@ class TestSentence:
         word = make_word("dog", "개", None, examples=[])
         assert engine.can_generate(word) is False
 
+    def test_try_generate_none_without_examples(self, sample_pool):
+        """try_generate should return None when no usable example exists."""
+        for name in ("sentence", "sentence_type"):
+            word = make_word("dog", "개", None, examples=[])
+            assert get_engine(name).try_generate(word, sample_pool) is None
+
+    def test_sentence_type_spec_fields(self, sample_pool):
+        """sentence_type should fill every spec field from the word and its example."""
+        word = make_word("dog", "개", "I have a dog.", examples=[])
+        word.example_ko = "나는 개가 있다."
+        spec = get_engine("sentence_type").generate(word, sample_pool)
+
+        assert spec.question_type == "sentence_type"
+        assert spec.word is word
+        assert spec.correct_answer == "dog"
+        assert spec.choices is None
+        assert spec.is_typing is True
+        assert spec.context_mode == "sentence"
+        assert spec.sentence_blank == "I have a ____."
+        assert spec.sentence_en == "I have a dog."
+        assert spec.sentence_ko == "나는 개가 있다."
+        assert spec.emoji is None
+        assert spec.hint == "d__"
+
     def test_generate_picks_from_examples(self, sample_pool):
         """generate should use word.examples when available."""
         engine = get_engine("sentence")
@@ -617,6 +749,13 @@ class TestAntonymEngines:
         assert spec.is_typing is True
         assert spec.hint == "c___"
 
+    def test_antonym_type_try_generate_without_antonym(self, sample_pool):
+        """antonym_type try_generate should return None if word has no antonym."""
+        engine = get_engine("antonym_type")
+        word = make_word("dog", "개")
+        word.antonym = None
+        assert engine.try_generate(word, sample_pool) is None
+
     def test_antonym_choice_can_generate_with_antonym(self):
         """antonym_choice can_generate should return True if word has antonym."""
         engine = get_engine("antonym_choice")
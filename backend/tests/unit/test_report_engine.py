@@ -232,6 +232,19 @@ class TestTimeBreakdown:
         assert total is None
         assert categories == {}
 
+    def test_stage_fallback_and_unknown(self):
+        """Untyped answers use the stage map; unknown ones count as 기타."""
+        answers = [
+            {"stage": 1, "time_taken_seconds": 4.0},
+            {"question_type": "", "stage": 4, "time_taken_seconds": 6.0},
+            {"question_type": "mystery", "time_taken_seconds": 2.0},
+            {"time_taken_seconds": 3.0},
+        ]
+        total, categories = calculate_time_breakdown(answers)
+
+        assert total == 15
+        assert categories == {"의미파악력": 4, "발음청취력": 6, "기타": 5}
+
 
 # ---------------------------------------------------------------------------
 # TestSkillAreaScores - skill area score calculation
@@ -319,6 +332,17 @@ class TestStaticMappings:
         assert 1 in RANK_TO_GRADE
         assert 15 in RANK_TO_GRADE
 
+    def test_rank_rows_match_tables(self):
+        """The rank-indexed rows should agree with the dict tables, fallbacks included."""
+        from app.services import report_engine
+
+        for rank in range(-1, 18):
+            assert report_engine._rank_row(rank) == (
+                RANK_TO_GRADE.get(rank, "미정"),
+                report_engine._RANK_VOCAB_LABEL.get(rank, "어휘"),
+                RANK_TO_BOOK.get(rank, ""),
+            )
+
     def test_rank_to_book_15(self):
         """RANK_TO_BOOK should have at least 15 entries."""
         assert len(RANK_TO_BOOK) >= 15
@@ -388,3 +412,10 @@ class TestStaticMappings:
             assert "my_score" in d
             assert "description" in d
             assert d["my_score"] == metrics[d["key"]]
+
+    def test_metric_descriptions_cover_every_tier(self):
+        """report_texts.ko.json should describe every skill area at every tier."""
+        for score in (0.0, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 10.0):
+            metrics = dict.fromkeys(SKILL_AREA_NAMES, score)
+            for d in get_metric_descriptions(rank=1, metrics=metrics):
+                assert d["description"], (d["key"], score)